@@ -21,18 +21,31 @@ Note:
 
 from __future__ import annotations
 
-import json
-import uuid
-from dataclasses import dataclass
+import atexit
+import os
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-import argparse
-from typing import Dict, Any, Optional, List
+import sys
+import threading
+from typing import Dict, Any, Iterable, Iterator, Optional, Set, Tuple
+
+# Only the serializer that is actually used gets imported; argparse is
+# imported inside main() so programmatic users of run_turn() skip it.
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+    import json
 
 
 # --------------------------------------------------------------------
 # PLD Specification (Structural + Semantic Alignment Rules)
 # --------------------------------------------------------------------
 
+# Fixed envelope values shared by every event emitted by this script.
+SCHEMA_VERSION = "2.0"
+EVENT_SOURCE = "runtime"
+
 PREFIX_TO_PHASE = {
     "D": "drift",
     "R": "repair",
@@ -58,7 +71,9 @@ EVENT_TYPE_TO_PHASE_SHOULD = {
 
 @dataclass
 class Session:
-    session_id: str = str(uuid.uuid4())
+    # A default_factory gives every Session its own ID; a plain default
+    # would be evaluated once at import and shared by all sessions.
+    session_id: str = field(default_factory=lambda: new_event_id())
     turn: int = 0
 
     def begin_turn(self) -> int:
@@ -69,7 +84,109 @@ class Session:
 
 def timestamp() -> str:
     """Return RFC3339/ISO-8601 UTC timestamp with 'Z' suffix."""
-    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    # Fixed microsecond precision; slice off the "+00:00" offset instead of
+    # scanning for it with str.replace.
+    return datetime.now(timezone.utc).isoformat(timespec="microseconds")[:-6] + "Z"
+
+
+# Number of event IDs generated per os.urandom() call.
+_EVENT_ID_BATCH = 256
+
+
+def _event_ids() -> Iterator[str]:
+    """
+    Yield random UUIDv4 strings, drawing entropy in batches.
+
+    One os.urandom() call covers _EVENT_ID_BATCH IDs, and the canonical
+    8-4-4-4-12 form is formatted directly from the bytes instead of going
+    through uuid.UUID objects.
+    """
+    while True:
+        buf = bytearray(os.urandom(16 * _EVENT_ID_BATCH))
+        for i in range(0, len(buf), 16):
+            buf[i + 6] = (buf[i + 6] & 0x0F) | 0x40  # version 4
+            buf[i + 8] = (buf[i + 8] & 0x3F) | 0x80  # RFC 4122 variant
+            h = buf[i:i + 16].hex()
+            yield f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+_EVENT_ID_GEN = _event_ids()
+# A generator cannot be resumed from two threads at once.
+_EVENT_ID_LOCK = threading.Lock()
+
+
+def new_event_id() -> str:
+    """Return a fresh UUIDv4 string for event_id. Safe to call from any thread."""
+    with _EVENT_ID_LOCK:
+        return next(_EVENT_ID_GEN)
+
+
+# OPT_NON_STR_KEYS matches json.dumps, which stringifies int/float/bool keys
+# instead of raising.
+_ORJSON_OPTS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS if orjson is not None else 0
+)
+
+
+def dumps_event(event: Dict[str, Any]) -> str:
+    """
+    Serialize an event as indented JSON for display.
+
+    Uses orjson when it is installed (much faster on nested event dicts)
+    and falls back to the standard library otherwise. Both paths produce
+    2-space indented, non-ASCII-escaped output, and both accept non-str
+    dict keys (e.g. ints in a payload), which json.dumps stringifies.
+    """
+    if orjson is not None:
+        return orjson.dumps(event, option=_ORJSON_OPTS).decode("utf-8")
+    return json.dumps(event, ensure_ascii=False, indent=2)
+
+
+def _dumps_event_bytes(event: Dict[str, Any]) -> bytes:
+    """Same output as dumps_event(), as UTF-8 bytes (no decode round-trip)."""
+    if orjson is not None:
+        return orjson.dumps(event, option=_ORJSON_OPTS)
+    return json.dumps(event, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+# ---------------------------------------------------------------------------
+# Output buffer
+# ---------------------------------------------------------------------------
+
+# Serialized events are appended to one shared, reused buffer and written
+# to stdout in large chunks instead of one write per event.
+_OUT_BUF = bytearray()
+_FLUSH_AT = 65536
+
+
+def _write_bytes(data: bytes) -> None:
+    _OUT_BUF.extend(data)
+    if len(_OUT_BUF) >= _FLUSH_AT:
+        flush_output()
+
+
+def _write_text(text: str) -> None:
+    _write_bytes(text.encode("utf-8"))
+
+
+def flush_output() -> None:
+    """Write any buffered output to stdout."""
+    if not _OUT_BUF:
+        return
+    try:
+        # Anything already written through the text layer (print) goes first.
+        sys.stdout.flush()
+        raw = getattr(sys.stdout, "buffer", None)
+        if raw is None:
+            # stdout replaced by a text-only stream (e.g. io.StringIO).
+            sys.stdout.write(_OUT_BUF.decode("utf-8"))
+        else:
+            raw.write(_OUT_BUF)
+            raw.flush()
+    finally:
+        # Drop the data even if the write failed (e.g. BrokenPipeError when
+        # piped into `head`), so the error surfaces once and is not retried.
+        _OUT_BUF.clear()
 
 
 # --------------------------------------------------------------------
@@ -89,14 +206,36 @@ DRIFT_KEYWORDS = {
 
 def detect_drift(text: str) -> bool:
     """Return True if the input looks off-task according to simple heuristics."""
+    # A plain loop of substring checks on one lowercased copy is much faster
+    # than a case-insensitive regex alternation. DRIFT_KEYWORDS is read on
+    # every call, so keywords added at runtime take effect.
     lowered = text.lower()
-    return any(k in lowered for k in DRIFT_KEYWORDS)
+    for kw in DRIFT_KEYWORDS:
+        if kw in lowered:
+            return True
+    return False
 
 
 # --------------------------------------------------------------------
 # PLD Event Creation + Validation
 # --------------------------------------------------------------------
 
+# (event_type, phase, code) triples that already passed validate() without
+# errors or warnings.
+_VALIDATED: Set[Tuple[str, str, str]] = set()
+
+# Code -> taxonomy prefix ("D4_detected" -> "D", "RE3_auto" -> "RE"),
+# filled on first sight of each code.
+_CODE_PREFIX: Dict[str, str] = {}
+
+
+def _code_prefix(code: str) -> str:
+    prefix = _CODE_PREFIX.get(code)
+    if prefix is None:
+        prefix = _CODE_PREFIX[code] = code.split("_")[0].rstrip("0123456789")
+    return prefix
+
+
 def validate(event: Dict[str, Any]) -> None:
     """
     Ensure event adheres to core PLD semantic constraints.
@@ -107,13 +246,21 @@ def validate(event: Dict[str, Any]) -> None:
       - SHOULD-level event_type ↔ phase mappings as warnings
 
     It does NOT replace full JSON Schema validation.
+
+    The checks depend only on (event_type, phase, code), so triples that
+    pass cleanly are remembered and later events with the same triple
+    return after a single set lookup.
     """
     phase = event["pld"]["phase"]
     code = event["pld"]["code"]
     event_type = event["event_type"]
 
+    key = (event_type, phase, code)
+    if key in _VALIDATED:
+        return
+
     # Prefix–phase constraint
-    prefix = code.split("_")[0].rstrip("0123456789")
+    prefix = _code_prefix(code)
     if prefix in PREFIX_TO_PHASE and PREFIX_TO_PHASE[prefix] != phase:
         raise ValueError(
             f"Prefix–phase mismatch: `{code}` requires `{PREFIX_TO_PHASE[prefix]}`, "
@@ -136,32 +283,65 @@ def validate(event: Dict[str, Any]) -> None:
                 f"[WARN] `{event_type}` SHOULD use phase `{expected}`, got `{phase}`.",
                 flush=True,
             )
+            # Not cached, so the warning is repeated for every such event.
+            return
 
+    _VALIDATED.add(key)
 
-def build_event(
-    *,
-    session: Session,
+
+def _make_event(
+    session_id: str,
     event_type: str,
     phase: str,
     code: str,
     turn_sequence: int,
-    visible: bool = False,
-    payload: Optional[Dict[str, Any]] = None,
+    visible: bool,
+    payload: Optional[Dict[str, Any]],
+    timestamp_override: Optional[str],
 ) -> Dict[str, Any]:
-    """Construct a PLD-compliant event dictionary (minimal subset)."""
-    event = {
-        "schema_version": "2.0",
-        "event_id": str(uuid.uuid4()),
-        "timestamp": timestamp(),
-        "session_id": session.session_id,
+    """
+    Assemble an event dictionary without validating it.
+
+    The event is built as a single dict literal: CPython compiles this into
+    one pre-sized dict construction, which is cheaper than copying or
+    ``**``-merging a shared base template and keeps the key order stable.
+    """
+    return {
+        "schema_version": SCHEMA_VERSION,
+        "event_id": new_event_id(),
+        "timestamp": timestamp_override or timestamp(),
+        "session_id": session_id,
         "turn_sequence": turn_sequence,
-        "source": "runtime",
+        "source": EVENT_SOURCE,
         "event_type": event_type,
         "pld": {"phase": phase, "code": code},
         "payload": payload or {},
         "ux": {"user_visible_state_change": visible},
     }
 
+
+def build_event(
+    *,
+    session: Session,
+    event_type: str,
+    phase: str,
+    code: str,
+    turn_sequence: int,
+    visible: bool = False,
+    payload: Optional[Dict[str, Any]] = None,
+    timestamp_override: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Construct a PLD-compliant event dictionary (minimal subset).
+
+    If timestamp_override is given it is used verbatim; otherwise the
+    current UTC time is taken.
+    """
+    event = _make_event(
+        session.session_id, event_type, phase, code, turn_sequence,
+        visible, payload, timestamp_override,
+    )
+
     validate(event)
     return event
 
@@ -170,27 +350,48 @@ def build_event(
 # Human-readable Rendering Layer
 # --------------------------------------------------------------------
 
-def explain(event: Dict[str, Any]) -> None:
-    """Print a human-readable summary of a PLD event."""
+_PHASE_EMOJI = {
+    "drift": "🚨",
+    "repair": "🔧",
+    "reentry": "🛂",
+    "continue": "✅",
+    "outcome": "🏁",
+    "failover": "❌",
+    "none": "ℹ️",
+}
+
+
+def format_explanation(event: Dict[str, Any]) -> str:
+    """Return the human-readable summary of a PLD event (with trailing blank line)."""
     phase = event["pld"]["phase"]
     code = event["pld"]["code"]
 
-    emoji = {
-        "drift": "🚨",
-        "repair": "🔧",
-        "reentry": "🛂",
-        "continue": "✅",
-        "outcome": "🏁",
-        "failover": "❌",
-        "none": "ℹ️",
-    }[phase]
-
-    print(f"{emoji}  {event['event_type']} ({code})")
-    print(
+    emoji = _PHASE_EMOJI[phase]
+
+    return (
+        f"{emoji}  {event['event_type']} ({code})\n"
         f"Phase: {phase} | Turn: {event['turn_sequence']} | "
-        f"Event ID: {event['event_id']}"
+        f"Event ID: {event['event_id']}\n\n"
     )
-    print()
+
+
+def explain(event: Dict[str, Any]) -> None:
+    """Print a human-readable summary of a PLD event."""
+    sys.stdout.write(format_explanation(event))
+
+
+def write_events(events: Iterable[Dict[str, Any]], human_output: bool = False) -> None:
+    """
+    Append events (and their optional summaries) to the output buffer.
+
+    Output is identical to printing each event one by one. Data reaches
+    stdout once the buffer fills up or when flush_output() is called.
+    """
+    for e in events:
+        if human_output:
+            _write_text(format_explanation(e))
+        _write_bytes(_dumps_event_bytes(e))
+        _write_bytes(b"\n")
 
 
 # --------------------------------------------------------------------
@@ -210,87 +411,81 @@ def mock_system_response(drift_detected: bool, repair_applied: bool) -> str:
     return "Task execution continues normally."
 
 
-def run_turn(session: Session, user_input: str) -> List[Dict[str, Any]]:
+# (event_type, phase, code) of the fixed events emitted by run_turn().
+EventSpec = Tuple[str, str, str]
+
+_EMPTY_INPUT_EVENT: EventSpec = ("info", "none", "INFO_empty_input")
+_DRIFT_EVENTS: Tuple[EventSpec, ...] = (
+    ("drift_detected", "drift", "D4_detected"),
+    ("repair_triggered", "repair", "R1_retry"),
+    ("reentry_observed", "reentry", "RE3_auto"),
+)
+_CONTINUE_EVENT: EventSpec = ("continue_allowed", "continue", "C0_normal")
+_OUTCOME_EVENT: EventSpec = ("evaluation_pass", "outcome", "O1_success")
+
+# The specs are static, so they are validated once here instead of on every
+# emitted event. An invalid spec fails at import time.
+for _event_type, _phase, _code in (
+    _EMPTY_INPUT_EVENT, *_DRIFT_EVENTS, _CONTINUE_EVENT, _OUTCOME_EVENT
+):
+    validate({"event_type": _event_type, "pld": {"phase": _phase, "code": _code}})
+
+
+def _emit(
+    spec: EventSpec,
+    session_id: str,
+    turn_sequence: int,
+    ts: str,
+    payload: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """Build one of the fixed run_turn() events (pre-validated at import)."""
+    event_type, phase, code = spec
+    return _make_event(
+        session_id, event_type, phase, code, turn_sequence, False, payload, ts
+    )
+
+
+def run_turn(session: Session, user_input: str) -> Iterator[Dict[str, Any]]:
     """
-    Simulate one user turn and emit a sequence of PLD events
+    Simulate one user turn and yield a sequence of PLD events
     sharing the same turn_sequence.
+
+    Events are produced lazily, so callers that write them out one by one
+    never hold the whole turn in memory.
     """
     turn_sequence = session.begin_turn()
-    events: List[Dict[str, Any]] = []
+    # All events of a turn are emitted within microseconds of each other,
+    # so they share one timestamp instead of reading the clock per event.
+    ts = timestamp()
+    session_id = session.session_id
 
     if not user_input.strip():
-        events.append(
-            build_event(
-                session=session,
-                event_type="info",
-                phase="none",
-                code="INFO_empty_input",
-                turn_sequence=turn_sequence,
-            )
-        )
-        return events
+        yield _emit(_EMPTY_INPUT_EVENT, session_id, turn_sequence, ts)
+        return
 
     drift = detect_drift(user_input)
 
     if drift:
         # In this demo, we always attempt repair if drift is detected.
-        events.append(
-            build_event(
-                session=session,
-                event_type="drift_detected",
-                phase="drift",
-                code="D4_detected",
-                turn_sequence=turn_sequence,
-            )
-        )
-        events.append(
-            build_event(
-                session=session,
-                event_type="repair_triggered",
-                phase="repair",
-                code="R1_retry",
-                turn_sequence=turn_sequence,
-            )
-        )
-        events.append(
-            build_event(
-                session=session,
-                event_type="reentry_observed",
-                phase="reentry",
-                code="RE3_auto",
-                turn_sequence=turn_sequence,
-            )
-        )
+        for spec in _DRIFT_EVENTS:
+            yield _emit(spec, session_id, turn_sequence, ts)
     else:
-        events.append(
-            build_event(
-                session=session,
-                event_type="continue_allowed",
-                phase="continue",
-                code="C0_normal",
-                turn_sequence=turn_sequence,
-            )
-        )
+        yield _emit(_CONTINUE_EVENT, session_id, turn_sequence, ts)
 
     # Outcome event summarizing this turn
-    events.append(
-        build_event(
-            session=session,
-            event_type="evaluation_pass",
-            phase="outcome",
-            code="O1_success",
-            turn_sequence=turn_sequence,
-            payload={
-                "system_response": mock_system_response(
-                    drift_detected=drift,
-                    repair_applied=drift,
-                )
-            },
-        )
+    yield _emit(
+        _OUTCOME_EVENT,
+        session_id,
+        turn_sequence,
+        ts,
+        payload={
+            "system_response": mock_system_response(
+                drift_detected=drift,
+                repair_applied=drift,
+            )
+        },
     )
 
-    return events
-
 
 # --------------------------------------------------------------------
 # CLI Execution Modes
@@ -301,19 +496,28 @@ def interactive(human_output: bool = False) -> None:
     session = Session()
     print("\n🧪 Interactive PLD Runtime (type 'exit' to quit)\n")
 
-    while True:
-        try:
-            text = input("User> ")
-        except (EOFError, KeyboardInterrupt):
-            break
+    # Read lines straight from the buffered stdin iterator so that piped
+    # input (e.g. `cat turns.txt | ... --interactive`) is drained quickly.
+    # The prompt is only shown when a person is typing.
+    is_tty = sys.stdin.isatty()
 
-        if text.lower() in {"exit", "quit"}:
-            break
+    def prompt() -> None:
+        if is_tty:
+            sys.stdout.write("User> ")
+            sys.stdout.flush()
 
-        for e in run_turn(session, text):
-            if human_output:
-                explain(e)
-            print(json.dumps(e, ensure_ascii=False, indent=2))
+    prompt()
+    try:
+        for line in sys.stdin:
+            text = line.rstrip("\n")
+            if text.lower() in {"exit", "quit"}:
+                break
+
+            write_events(run_turn(session, text), human_output)
+            flush_output()
+            prompt()
+    except KeyboardInterrupt:
+        pass
 
 
 def examples(human_output: bool = False) -> None:
@@ -328,14 +532,14 @@ def examples(human_output: bool = False) -> None:
     ]
 
     for text in demo_inputs:
-        print(f"\n> {text}")
-        for e in run_turn(session, text):
-            if human_output:
-                explain(e)
-            print(json.dumps(e, ensure_ascii=False, indent=2))
+        _write_text(f"\n> {text}\n")
+        write_events(run_turn(session, text), human_output)
+    flush_output()
 
 
 def main() -> None:
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="PLD quickstart runtime example (drift → repair → reentry → outcome)."
     )
@@ -345,6 +549,9 @@ def main() -> None:
     parser.add_argument("--human", action="store_true", help="Show human-readable summaries")
     args = parser.parse_args()
 
+    # Flush whatever is still buffered if the CLI exits early.
+    atexit.register(flush_output)
+
     if args.interactive:
         interactive(args.human)
         return
@@ -356,10 +563,8 @@ def main() -> None:
     if args.text:
         session = Session()
         user_text = " ".join(args.text)
-        for event in run_turn(session, user_text):
-            if args.human:
-                explain(event)
-            print(json.dumps(event, ensure_ascii=False, indent=2))
+        write_events(run_turn(session, user_text), args.human)
+        flush_output()
         return
 
     # Default behavior: run examples.
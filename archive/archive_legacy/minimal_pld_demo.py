@@ -19,7 +19,6 @@ Relationship in the quickstart stack:
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 import sys
 
@@ -32,7 +31,12 @@ import sys
 SCRIPT_ROOT = Path(__file__).resolve().parent.parent
 sys.path.append(str(SCRIPT_ROOT))
 
-from run_minimal_engine import MinimalEngine, EngineConfig, explain_event  # type: ignore
+from run_minimal_engine import (  # type: ignore
+    MinimalEngine,
+    EngineConfig,
+    dumps_event,
+    explain_event,
+)
 
 
 def demo() -> None:
@@ -74,7 +78,7 @@ def demo() -> None:
             # Human-readable explanation (phase / code / turn)
             explain_event(event)
             # Raw JSON event (matches PLD v2.0 schema structure, minimal subset)
-            print(json.dumps(event, ensure_ascii=False, indent=2))
+            print(dumps_event(event))
 
 
 if __name__ == "__main__":
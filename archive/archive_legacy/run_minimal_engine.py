@@ -31,12 +31,17 @@ NOTE:
 from __future__ import annotations
 
 import argparse
-import json
-import uuid
+import sys
+import time
+import warnings
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
+# Event IDs and JSON rendering are shared with the sibling quickstart script
+# (same directory), so both scripts use one thread-safe ID generator and one
+# orjson/json serializer.
+from hello_pld_runtime import dumps_event, new_event_id
+
 
 # ----------------------------------------------------------------------
 # PLD Constants (Level 2 Semantics: Prefix/Phase + Event Type Mapping)
@@ -69,15 +74,28 @@ EVENT_TYPE_TO_PHASE_SHOULD = {
     "info": "none",
 }
 
+# Both event_type tables merged for validate_event(): event_type ->
+# (expected phase, True if MUST-level / False if SHOULD-level), so one
+# lookup decides whether and how an event_type is checked.
+_EVENT_TYPE_CHECK: Dict[str, Tuple[str, bool]] = {
+    **{et: (ph, False) for et, ph in EVENT_TYPE_TO_PHASE_SHOULD.items()},
+    **{et: (ph, True) for et, ph in EVENT_TYPE_TO_PHASE_MUST.items()},
+}
+
 
 # ----------------------------------------------------------------------
 # Session + Engine State
 # ----------------------------------------------------------------------
 
-@dataclass
+# Slot-based dataclasses (no per-instance __dict__) where the running
+# Python supports them; dataclass(slots=...) was added in 3.10.
+_DATACLASS_OPTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTS)
 class SessionState:
     """Holds per-session identifiers and monotonic turn counter."""
-    session_id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    session_id: str = field(default_factory=lambda: new_event_id())
     turn_sequence: int = 0
 
     def begin_turn(self) -> int:
@@ -91,7 +109,7 @@ class SessionState:
         return self.turn_sequence
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTS)
 class EngineState:
     """
     Tracks runtime state across turns.
@@ -106,8 +124,10 @@ class EngineState:
 # Default Strategies (can be swapped out via EngineConfig)
 # ----------------------------------------------------------------------
 
-# Heuristic keywords for "off-task" behavior.
-DRIFT_KEYWORDS = {
+# Heuristic keywords for "off-task" behavior. Immutable: the scan order
+# below is derived from it once, at import. To detect other keywords, pass
+# a custom drift_detector via EngineConfig (and override _agent_step).
+DRIFT_KEYWORDS = frozenset({
     "off-topic",
     "unrelated",
     "cooking",
@@ -116,7 +136,33 @@ DRIFT_KEYWORDS = {
     "switch",
     "penguin",
     "random",
-}
+})
+
+# Keywords that trigger most drift turns in practice (the demo and typical
+# interactive inputs); scanned first so a drift turn usually stops early.
+_DRIFT_SCAN_FIRST = ("switch", "cooking", "off-topic")
+
+# Keywords actually scanned for, in scan order. Any keyword that contains
+# another keyword (e.g. "switch topic" ⊃ "switch") can never change the
+# outcome and is dropped.
+_DRIFT_SCAN: Tuple[str, ...] = tuple(
+    kw
+    for kw in sorted(
+        DRIFT_KEYWORDS,
+        key=lambda k: (
+            _DRIFT_SCAN_FIRST.index(k) if k in _DRIFT_SCAN_FIRST else len(_DRIFT_SCAN_FIRST),
+            k,
+        ),
+    )
+    if not any(other != kw and other in kw for other in DRIFT_KEYWORDS)
+)
+
+
+def _has_drift_keyword(text_lower: str) -> bool:
+    for kw in _DRIFT_SCAN:
+        if kw in text_lower:
+            return True
+    return False
 
 
 def default_drift_detector(user_input: str, agent_plan: str) -> Tuple[bool, str]:
@@ -130,11 +176,20 @@ def default_drift_detector(user_input: str, agent_plan: str) -> Tuple[bool, str]
       - LLM-based classification,
       - policy checks, etc.
     """
-    text = (user_input + " " + agent_plan).lower()
-    for kw in DRIFT_KEYWORDS:
-        if kw in text:
+    return _detect_drift_lower(user_input.lower(), agent_plan.lower())
+
+
+def _detect_drift_lower(user_lower: str, plan_lower: str) -> Tuple[bool, str]:
+    """default_drift_detector on already-lowercased inputs."""
+    # Scan both texts separately rather than building a joined copy. No
+    # scanned keyword (nor "plan") contains a space, so none could match
+    # across the joining space and the result is unchanged.
+    for kw in _DRIFT_SCAN:
+        if kw in user_lower or kw in plan_lower:
             # Tiny example: if the word "plan" appears, treat as repeated plan.
-            return True, "D3_repeated_plan" if "plan" in text else "D4_tool_error"
+            if "plan" in user_lower or "plan" in plan_lower:
+                return True, "D3_repeated_plan"
+            return True, "D4_tool_error"
     return False, "D0_none"
 
 
@@ -179,7 +234,7 @@ def default_reentry_strategy(
     return True, "RE3_auto"
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTS)
 class EngineConfig:
     """
     Engine configuration.
@@ -196,27 +251,95 @@ class EngineConfig:
     validation_mode:
       - "strict": raise on semantic violations (good for learning)
       - "warn":   print warnings but do not raise (good for experiments)
+
+    emit_payloads:
+      - True:  events carry bookkeeping payloads (user input, responses)
+      - False: events are emitted with an empty payload, which skips
+               building those dicts when only the final response is used
+
+    strict is a read-only view of validation_mode; unknown modes are
+    treated as "strict" for safety.
     """
     drift_detector: Callable[[str, str], Tuple[bool, str]] = default_drift_detector
     repair_strategy: Callable[[str, int], str] = default_repair_strategy
     reentry_strategy: Callable[[str, str, str], Tuple[bool, str]] = default_reentry_strategy
     validation_mode: str = "strict"  # "strict" or "warn"
+    emit_payloads: bool = True
+
+    @property
+    def strict(self) -> bool:
+        return self.validation_mode != "warn"
 
 
 # ----------------------------------------------------------------------
 # Utility Functions
 # ----------------------------------------------------------------------
 
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") of the most recent timestamp. Kept as
+# one tuple so readers never see a second paired with another second's text.
+_TS_CACHE: Tuple[int, str] = (-1, "")
+
+
 def utc_timestamp() -> str:
     """Return RFC3339/ISO-8601 UTC timestamp with 'Z' suffix."""
-    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+    global _TS_CACHE
+    sec, nsec = divmod(time.time_ns(), 1_000_000_000)
+    cached_sec, prefix = _TS_CACHE
+    if sec != cached_sec:
+        # Only the sub-second part changes between events of a turn, so the
+        # date/time formatting runs at most once per wall-clock second.
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _TS_CACHE = (sec, prefix)
+    return f"{prefix}.{nsec // 1000:06d}Z"
 
 
 # ----------------------------------------------------------------------
 # PLD Event Validation + Construction (Minimal Subset)
 # ----------------------------------------------------------------------
 
-def validate_event(event: Dict[str, Any], mode: str = "strict") -> None:
+# Code -> phase required by its lifecycle prefix (None for non-lifecycle
+# prefixes such as INFO_). Filled on first sight of each code, so the
+# handful of codes an engine emits are resolved with one dict lookup.
+_CODE_PHASE_CACHE: Dict[str, Optional[str]] = {}
+
+
+def _code_phase(code: str) -> Optional[str]:
+    if code in _CODE_PHASE_CACHE:
+        return _CODE_PHASE_CACHE[code]
+    prefix = code.split("_", 1)[0].rstrip("0123456789")
+    phase = _CODE_PHASE_CACHE[code] = PREFIX_TO_PHASE.get(prefix)
+    return phase
+
+
+def _warn_semantic(msg: str) -> None:
+    """
+    Report a semantic violation that does not raise.
+
+    Written to stdout like the events themselves, without forcing a flush:
+    ordering relative to other stdout output is preserved either way, and a
+    noisy "warn" run no longer pays one flush per warning.
+    """
+    sys.stdout.write(f"[WARN][semantic] {msg}\n")
+
+
+def _is_strict_mode(mode: str) -> bool:
+    """Map a validation mode string to the strict flag ("warn" -> False)."""
+    return mode != "warn"
+
+
+def _warn_deprecated_kwarg(old: str, new: str) -> None:
+    warnings.warn(
+        f"{old}= is deprecated; use {new}= instead.",
+        DeprecationWarning,
+        stacklevel=3,
+    )
+
+
+def validate_event(
+    event: Dict[str, Any],
+    strict: bool = True,
+    mode: Optional[str] = None,
+) -> None:
     """
     Ensure event adheres to core PLD semantic constraints.
 
@@ -226,34 +349,36 @@ def validate_event(event: Dict[str, Any], mode: str = "strict") -> None:
       - SHOULD-level event_type ↔ phase mappings (warning only)
 
     Modes:
-      - "strict": raise ValueError on MUST/prefix violations.
-      - "warn":   only print warnings, do not raise.
+      - strict=True  ("strict"): raise ValueError on MUST/prefix violations.
+      - strict=False ("warn"):   only print warnings, do not raise.
+
+    mode="strict"/"warn" is the deprecated keyword form of strict and is
+    still accepted.
 
     NOTE:
         This function purposely does NOT perform full JSON Schema
         validation. It focuses on Level 2 semantics (matrix rules).
     """
+    if mode is not None:
+        _warn_deprecated_kwarg("mode", "strict")
+        strict = _is_strict_mode(mode)
+
     phase = event["pld"]["phase"]
     code = event["pld"]["code"]
     event_type = event["event_type"]
 
-    # Normalize unknown validation modes to "strict" for safety.
-    if mode not in ("strict", "warn"):
-        mode = "strict"
-
     # Prefix–phase constraint
-    prefix = code.split("_")[0].rstrip("0123456789")
-    if prefix in PREFIX_TO_PHASE:
-        required_phase = PREFIX_TO_PHASE[prefix]
+    required_phase = _code_phase(code)
+    if required_phase is not None:
         if required_phase != phase:
             msg = (
                 f"Prefix–phase mismatch: `{code}` requires `{required_phase}`, "
                 f"got `{phase}`."
             )
-            if mode == "strict":
+            if strict:
                 raise ValueError(msg)
             else:
-                print(f"[WARN][semantic] {msg}", flush=True)
+                _warn_semantic(msg)
     else:
         # Non-lifecycle prefixes (e.g., INFO_, SYS_) are expected to use phase="none"
         if phase != "none":
@@ -261,35 +386,31 @@ def validate_event(event: Dict[str, Any], mode: str = "strict") -> None:
                 f"Non-lifecycle prefix in code `{code}` requires phase='none', "
                 f"got `{phase}`."
             )
-            if mode == "strict":
+            if strict:
                 raise ValueError(msg)
             else:
-                print(f"[WARN][semantic] {msg}", flush=True)
-
-    # MUST-level mapping
-    if event_type in EVENT_TYPE_TO_PHASE_MUST:
-        required = EVENT_TYPE_TO_PHASE_MUST[event_type]
-        if required != phase:
-            msg = f"`{event_type}` MUST map to phase `{required}`, got `{phase}`."
-            if mode == "strict":
+                _warn_semantic(msg)
+
+    # event_type → phase mapping (MUST-level raises in strict mode,
+    # SHOULD-level is warning only)
+    check = _EVENT_TYPE_CHECK.get(event_type)
+    if check is not None and check[0] != phase:
+        expected, must = check
+        if must:
+            msg = f"`{event_type}` MUST map to phase `{expected}`, got `{phase}`."
+            if strict:
                 raise ValueError(msg)
             else:
-                print(f"[WARN][semantic] {msg}", flush=True)
-
-    # SHOULD-level mapping (warning only)
-    if event_type in EVENT_TYPE_TO_PHASE_SHOULD:
-        expected = EVENT_TYPE_TO_PHASE_SHOULD[event_type]
-        if expected != phase:
-            print(
-                f"[WARN][semantic] `{event_type}` SHOULD use phase `{expected}`, "
-                f"got `{phase}`.",
-                flush=True,
+                _warn_semantic(msg)
+        else:
+            _warn_semantic(
+                f"`{event_type}` SHOULD use phase `{expected}`, got `{phase}`."
             )
 
 
 def make_event(
     *,
-    session: SessionState,
+    session_id: Optional[str] = None,
     event_type: str,
     phase: str,
     code: str,
@@ -298,17 +419,37 @@ def make_event(
     visible: bool = False,
     payload: Optional[Dict[str, Any]] = None,
     runtime: Optional[Dict[str, Any]] = None,
-    validation_mode: str = "strict",
+    strict: bool = True,
+    trusted: bool = False,
+    session: Optional[SessionState] = None,
+    validation_mode: Optional[str] = None,
 ) -> Dict[str, Any]:
     """
     Construct a PLD event dictionary compatible with the v2.0 schema
-    (minimal subset) and validate it using the given validation_mode.
+    (minimal subset) and validate it (strict=False only warns).
+
+    trusted=True skips validation. It is meant only for engine-internal
+    events whose (event_type, phase, code) are fixed literals known to be
+    consistent; anything derived from strategies or user code must be
+    validated.
+
+    session= and validation_mode= are deprecated aliases for session_id=
+    and strict=.
     """
+    if session is not None:
+        _warn_deprecated_kwarg("session", "session_id")
+        session_id = session.session_id
+    if validation_mode is not None:
+        _warn_deprecated_kwarg("validation_mode", "strict")
+        strict = _is_strict_mode(validation_mode)
+    if session_id is None:
+        raise TypeError("make_event() missing required keyword argument: 'session_id'")
+
     event: Dict[str, Any] = {
         "schema_version": "2.0",
-        "event_id": str(uuid.uuid4()),
+        "event_id": new_event_id(),
         "timestamp": utc_timestamp(),
-        "session_id": session.session_id,
+        "session_id": session_id,
         "turn_sequence": turn_sequence,
         "source": source,
         "event_type": event_type,
@@ -320,36 +461,39 @@ def make_event(
     if runtime is not None:
         event["runtime"] = runtime
 
-    validate_event(event, mode=validation_mode)
+    if not trusted:
+        validate_event(event, strict=strict)
     return event
 
 
 # ----------------------------------------------------------------------
-# Human-readable Rendering
+# Rendering (JSON + human-readable)
 # ----------------------------------------------------------------------
 
+_PHASE_EMOJI: Dict[str, str] = {
+    "drift": "🚨",
+    "repair": "🔧",
+    "reentry": "🛂",
+    "continue": "✅",
+    "outcome": "🏁",
+    "failover": "❌",
+    "none": "ℹ️",
+}
+
+
 def explain_event(event: Dict[str, Any]) -> None:
     """Print a human-readable summary of a PLD event."""
     phase = event["pld"]["phase"]
     code = event["pld"]["code"]
     event_type = event["event_type"]
 
-    emoji = {
-        "drift": "🚨",
-        "repair": "🔧",
-        "reentry": "🛂",
-        "continue": "✅",
-        "outcome": "🏁",
-        "failover": "❌",
-        "none": "ℹ️",
-    }.get(phase, "❓")
-
-    print(f"{emoji}  {event_type} ({code})")
-    print(
+    emoji = _PHASE_EMOJI.get(phase, "❓")
+
+    sys.stdout.write(
+        f"{emoji}  {event_type} ({code})\n"
         f"Phase: {phase} | Turn: {event['turn_sequence']} | "
-        f"Event ID: {event['event_id']}"
+        f"Event ID: {event['event_id']}\n\n"
     )
-    print()
 
 
 # ----------------------------------------------------------------------
@@ -368,7 +512,8 @@ class MinimalEngine:
       5. Emit a sequence of PLD events for this turn
 
     The engine is "mechanism"; the strategies (detectors, repair, reentry)
-    are injected via EngineConfig.
+    are injected via EngineConfig. The config is read live: changes to
+    self.config (or a new one) apply from the next strategy call or turn.
     """
 
     def __init__(self, config: Optional[EngineConfig] = None):
@@ -376,6 +521,15 @@ class MinimalEngine:
         self.config = config or EngineConfig()
         self.state = EngineState()
 
+        # Subclasses may override the _agent_step/_detect_phase hooks; only
+        # when neither is overridden can run_turn share one lowercased copy
+        # of the input between them.
+        cls = type(self)
+        self._lower_once = (
+            cls._agent_step is MinimalEngine._agent_step
+            and cls._detect_phase is MinimalEngine._detect_phase
+        )
+
     # ---- Public orchestration ---------------------------------------
 
     def run_turn(self, user_input: str) -> Tuple[str, List[Dict[str, Any]]]:
@@ -385,16 +539,28 @@ class MinimalEngine:
           - the list of PLD events for that turn.
         """
         turn_sequence = self.session.begin_turn()
-        mode = self.config.validation_mode
-
-        if not user_input.strip():
-            return self._handle_empty_input(user_input, turn_sequence, mode)
-
-        # 1. Execute agent step
-        candidate_response = self._agent_step(user_input)
+        strict = self.config.strict
+
+        # Same test as `not user_input.strip()`, without allocating a copy.
+        if not user_input or user_input.isspace():
+            return self._handle_empty_input(user_input, turn_sequence, strict)
+
+        if self._lower_once:
+            # Lowercased once per turn; shared by the agent step and the
+            # default drift detector.
+            user_lower = user_input.lower()
+            candidate_response = self._agent_step_lower(user_lower)
+            drift_detected, drift_code = self._detect_phase_lower(
+                user_input, user_lower, candidate_response
+            )
+        else:
+            # 1. Execute agent step
+            candidate_response = self._agent_step(user_input)
 
-        # 2. Detect drift
-        drift_detected, drift_code = self._detect_phase(user_input, candidate_response)
+            # 2. Detect drift
+            drift_detected, drift_code = self._detect_phase(
+                user_input, candidate_response
+            )
 
         if drift_detected:
             return self._handle_drift_turn(
@@ -402,14 +568,14 @@ class MinimalEngine:
                 candidate_response=candidate_response,
                 drift_code=drift_code,
                 turn_sequence=turn_sequence,
-                validation_mode=mode,
+                strict=strict,
             )
         else:
             return self._handle_no_drift_turn(
                 user_input=user_input,
                 candidate_response=candidate_response,
                 turn_sequence=turn_sequence,
-                validation_mode=mode,
+                strict=strict,
             )
 
     # ---- Internal steps (mechanism) ---------------------------------
@@ -427,16 +593,36 @@ class MinimalEngine:
             best-practice agent policy, only as a plausible behavior
             to generate meaningful PLD events.
         """
-        if any(kw in user_input.lower() for kw in DRIFT_KEYWORDS):
-            return "Let me answer that, even if it might be off our main task."
-        return "Continuing with the main task as requested."
+        return self._agent_step_lower(user_input.lower())
 
     def _detect_phase(self, user_input: str, candidate_response: str) -> Tuple[bool, str]:
         """
         Detect whether the combined behavior indicates drift by using
         the configured drift_detector strategy.
         """
-        return self.config.drift_detector(user_input, candidate_response)
+        return self._detect_phase_lower(
+            user_input, user_input.lower(), candidate_response
+        )
+
+    def _agent_step_lower(self, user_lower: str) -> str:
+        """_agent_step on already-lowercased input."""
+        if _has_drift_keyword(user_lower):
+            return "Let me answer that, even if it might be off our main task."
+        return "Continuing with the main task as requested."
+
+    def _detect_phase_lower(
+        self, user_input: str, user_lower: str, candidate_response: str
+    ) -> Tuple[bool, str]:
+        """
+        _detect_phase with the turn's lowercased input precomputed.
+
+        The default detector is fed the lowercased input directly; custom
+        strategies always receive the original text.
+        """
+        detector = self.config.drift_detector
+        if detector is default_drift_detector:
+            return _detect_drift_lower(user_lower, candidate_response.lower())
+        return detector(user_input, candidate_response)
 
     def _apply_repair(
         self,
@@ -477,30 +663,34 @@ class MinimalEngine:
         self,
         user_input: str,
         turn_sequence: int,
-        validation_mode: str,
+        strict: bool,
     ) -> Tuple[str, List[Dict[str, Any]]]:
         """Handle the special case where the user input is empty."""
         events: List[Dict[str, Any]] = []
+        emit_payloads = self.config.emit_payloads
+        session_id = self.session.session_id
 
         info_event = make_event(
-            session=self.session,
+            session_id=session_id,
             event_type="info",
             phase="none",
             code="INFO_empty_input",
             turn_sequence=turn_sequence,
-            payload={"user_input": user_input},
-            validation_mode=validation_mode,
+            payload={"user_input": user_input} if emit_payloads else None,
+            strict=strict,
+            trusted=True,
         )
         events.append(info_event)
 
         outcome_event = make_event(
-            session=self.session,
+            session_id=session_id,
             event_type="evaluation_pass",
             phase="outcome",
             code="O0_noop",
             turn_sequence=turn_sequence,
-            payload={"summary": "No input to process."},
-            validation_mode=validation_mode,
+            payload={"summary": "No input to process."} if emit_payloads else None,
+            strict=strict,
+            trusted=True,
         )
         events.append(outcome_event)
 
@@ -512,7 +702,7 @@ class MinimalEngine:
         candidate_response: str,
         drift_code: str,
         turn_sequence: int,
-        validation_mode: str,
+        strict: bool,
     ) -> Tuple[str, List[Dict[str, Any]]]:
         """
         Handle a turn where drift has been detected:
@@ -522,11 +712,13 @@ class MinimalEngine:
           - emit continue/outcome events
         """
         events: List[Dict[str, Any]] = []
+        emit_payloads = self.config.emit_payloads
+        session_id = self.session.session_id
 
         # Drift event
         events.append(
             make_event(
-                session=self.session,
+                session_id=session_id,
                 event_type="drift_detected",
                 phase="drift",
                 code=drift_code,
@@ -535,9 +727,9 @@ class MinimalEngine:
                 payload={
                     "user_input": user_input,
                     "agent_plan": candidate_response,
-                },
+                } if emit_payloads else None,
                 runtime={"agent_state": "drift_detected"},
-                validation_mode=validation_mode,
+                strict=strict,
             )
         )
 
@@ -553,7 +745,7 @@ class MinimalEngine:
 
         events.append(
             make_event(
-                session=self.session,
+                session_id=session_id,
                 event_type="repair_triggered",
                 phase="repair",
                 code=repair_code,
@@ -563,8 +755,8 @@ class MinimalEngine:
                     "user_input": user_input,
                     "previous_response": candidate_response,
                     "repaired_response": repaired_response,
-                },
-                validation_mode=validation_mode,
+                } if emit_payloads else None,
+                strict=strict,
             )
         )
 
@@ -578,48 +770,50 @@ class MinimalEngine:
         if reentry_ok:
             events.append(
                 make_event(
-                    session=self.session,
+                    session_id=session_id,
                     event_type="reentry_observed",
                     phase="reentry",
                     code=reentry_code,
                     turn_sequence=turn_sequence,
                     source="detector",
-                    payload={"repair_code": repair_code},
-                    validation_mode=validation_mode,
+                    payload={"repair_code": repair_code} if emit_payloads else None,
+                    strict=strict,
                 )
             )
             events.append(
                 make_event(
-                    session=self.session,
+                    session_id=session_id,
                     event_type="continue_allowed",
                     phase="continue",
                     code="C0_after_repair",
                     turn_sequence=turn_sequence,
                     payload={
                         "note": "Execution continues after successful repair.",
-                    },
-                    validation_mode=validation_mode,
+                    } if emit_payloads else None,
+                    strict=strict,
+                    trusted=True,
                 )
             )
         else:
             events.append(
                 make_event(
-                    session=self.session,
+                    session_id=session_id,
                     event_type="continue_blocked",
                     phase="continue",
                     code="C1_blocked_after_repair",
                     turn_sequence=turn_sequence,
                     payload={
                         "note": "Execution blocked after failed repair.",
-                    },
-                    validation_mode=validation_mode,
+                    } if emit_payloads else None,
+                    strict=strict,
+                    trusted=True,
                 )
             )
 
         # Outcome for this turn
         events.append(
             make_event(
-                session=self.session,
+                session_id=session_id,
                 event_type="evaluation_pass",
                 phase="outcome",
                 code="O1_success",
@@ -628,8 +822,9 @@ class MinimalEngine:
                     "user_input": user_input,
                     "final_response": repaired_response,
                     "drift_detected": True,
-                },
-                validation_mode=validation_mode,
+                } if emit_payloads else None,
+                strict=strict,
+                trusted=True,
             )
         )
 
@@ -640,7 +835,7 @@ class MinimalEngine:
         user_input: str,
         candidate_response: str,
         turn_sequence: int,
-        validation_mode: str,
+        strict: bool,
     ) -> Tuple[str, List[Dict[str, Any]]]:
         """
         Handle a turn where no drift has been detected:
@@ -648,10 +843,12 @@ class MinimalEngine:
           - emit outcome event
         """
         events: List[Dict[str, Any]] = []
+        emit_payloads = self.config.emit_payloads
+        session_id = self.session.session_id
 
         events.append(
             make_event(
-                session=self.session,
+                session_id=session_id,
                 event_type="continue_allowed",
                 phase="continue",
                 code="C0_normal",
@@ -659,14 +856,15 @@ class MinimalEngine:
                 payload={
                     "user_input": user_input,
                     "agent_response": candidate_response,
-                },
-                validation_mode=validation_mode,
+                } if emit_payloads else None,
+                strict=strict,
+                trusted=True,
             )
         )
 
         events.append(
             make_event(
-                session=self.session,
+                session_id=session_id,
                 event_type="evaluation_pass",
                 phase="outcome",
                 code="O1_success",
@@ -675,8 +873,9 @@ class MinimalEngine:
                     "user_input": user_input,
                     "final_response": candidate_response,
                     "drift_detected": False,
-                },
-                validation_mode=validation_mode,
+                } if emit_payloads else None,
+                strict=strict,
+                trusted=True,
             )
         )
 
@@ -713,7 +912,7 @@ def run_demo_session(human: bool = True, validation_mode: str = "strict") -> Non
         for event in events:
             if human:
                 explain_event(event)
-            print(json.dumps(event, ensure_ascii=False, indent=2))
+            print(dumps_event(event))
 
 
 def interactive_session(human: bool = True, validation_mode: str = "strict") -> None:
@@ -739,7 +938,7 @@ def interactive_session(human: bool = True, validation_mode: str = "strict") ->
         for event in events:
             if human:
                 explain_event(event)
-            print(json.dumps(event, ensure_ascii=False, indent=2))
+            print(dumps_event(event))
         print()
 
 
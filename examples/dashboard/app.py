@@ -38,63 +38,112 @@ Default input:
 from __future__ import annotations
 
 import argparse
+import itertools
 import json
 import sys
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from statistics import mean
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+
+# ---------------------------------------------------------------------------
+# Event type groups
+# ---------------------------------------------------------------------------
+
+_DRIFT_TYPES = frozenset({"drift_detected", "drift_escalated"})
+_REPAIR_TYPES = frozenset({"repair_triggered", "repair_escalated"})
+_RECOVERY_TYPES = frozenset({"continue_allowed", "reentry_observed"})
+_CONTINUE_TYPES = frozenset({"continue_allowed", "continue_blocked"})
 
 
 # ---------------------------------------------------------------------------
 # Data models
 # ---------------------------------------------------------------------------
 
+# Slot-based dataclasses (no per-instance __dict__) where the running
+# Python supports them; dataclass(slots=...) was added in 3.10.
+_DATACLASS_OPTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
-@dataclass
 class Event:
     """Thin wrapper around a raw PLD event dict.
 
     This wrapper never mutates the underlying event structure; it only exposes
     convenience accessors for fields used by the demo dashboard.
+
+    The fields read while sorting, classifying and rendering sessions are
+    copied into slots once at construction, so those reads are plain
+    attribute lookups instead of property calls plus dict lookups. Rarely
+    used fields remain properties over ``raw``. Equality compares ``raw``
+    only, and events are unhashable, as with the former dataclass.
     """
 
-    raw: Dict[str, Any]
+    __slots__ = (
+        "raw",
+        "session_id",
+        "turn_sequence",
+        "event_type",
+        "phase",
+        "code",
+        "timestamp",
+        "_ts_dt",
+    )
+
+    def __init__(self, raw: Dict[str, Any]) -> None:
+        self.raw = raw
+        self.session_id: Optional[str] = raw.get("session_id")
+        self.turn_sequence: Optional[int] = raw.get("turn_sequence")
+        etype = raw.get("event_type")
+        # Only string event types can match a known type; anything else is
+        # treated as missing so the frozenset membership tests below never
+        # see an unhashable value from a malformed record.
+        self.event_type: Optional[str] = etype if isinstance(etype, str) else None
+        pld = raw.get("pld")
+        if not isinstance(pld, dict):
+            pld = {}
+        self.phase: Optional[str] = pld.get("phase")
+        self.code: Optional[str] = pld.get("code")
+        self.timestamp: Optional[str] = raw.get("timestamp")
+
+    def __repr__(self) -> str:
+        return f"Event(raw={self.raw!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self.raw == other.raw  # type: ignore[attr-defined]
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def parsed_timestamp(self) -> datetime:
+        """Return the timestamp as a naive UTC datetime, parsed at most once.
+
+        Values are only meant to be subtracted from one another (see VRL).
+        Parse errors are not cached; they propagate to the caller exactly as
+        from _parse_iso8601.
+        """
+        try:
+            return self._ts_dt
+        except AttributeError:
+            dt = self._ts_dt = _parse_iso8601_utc_naive(
+                self.timestamp  # type: ignore[arg-type]
+            )
+            return dt
 
     @property
     def schema_version(self) -> Optional[str]:
         return self.raw.get("schema_version")
 
-    @property
-    def session_id(self) -> Optional[str]:
-        return self.raw.get("session_id")
-
     @property
     def event_id(self) -> Optional[str]:
         return self.raw.get("event_id")
 
-    @property
-    def turn_sequence(self) -> Optional[int]:
-        return self.raw.get("turn_sequence")
-
-    @property
-    def event_type(self) -> Optional[str]:
-        return self.raw.get("event_type")
-
-    @property
-    def phase(self) -> Optional[str]:
-        pld = self.raw.get("pld") or {}
-        return pld.get("phase")
-
-    @property
-    def code(self) -> Optional[str]:
-        pld = self.raw.get("pld") or {}
-        return pld.get("code")
-
-    @property
-    def timestamp(self) -> Optional[str]:
-        return self.raw.get("timestamp")
-
     @property
     def payload(self) -> Dict[str, Any]:
         payload = self.raw.get("payload")
@@ -106,12 +155,83 @@ class Event:
         return ux if isinstance(ux, dict) else {}
 
 
-@dataclass
+class _SessionFlags(NamedTuple):
+    """Per-session facts gathered in a single pass over the events."""
+
+    closed: bool
+    has_repair: bool
+    failover_count: int
+    lifecycle_count: int
+
+
+@dataclass(**_DATACLASS_OPTS)
 class SessionTrace:
-    """Container for all events belonging to a single session_id."""
+    """Container for all events belonging to a single session_id.
+
+    Events are appended while grouping and treated as read-only afterwards;
+    the session-level flags and the sorted event list are computed once, on
+    first use, under that assumption.
+    """
 
     session_id: str
     events: List[Event] = field(default_factory=list)
+    _flags: Optional[_SessionFlags] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _sorted: Optional[List[Event]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _compute_flags(self) -> _SessionFlags:
+        """Walk the events once and cache the flags used by the metrics."""
+        closed = False
+        repair = False
+        failover_count = 0
+        lifecycle_count = 0
+        for e in self.events:
+            etype = e.event_type
+            phase = e.phase
+            if phase and phase != "none":
+                lifecycle_count += 1
+            if etype == "session_closed":
+                closed = True
+            elif etype in _REPAIR_TYPES:
+                repair = True
+            elif etype == "failover_triggered" or (
+                etype == "fallback_executed" and phase == "failover"
+            ):
+                failover_count += 1
+        flags = self._flags = _SessionFlags(
+            closed, repair, failover_count, lifecycle_count
+        )
+        return flags
+
+    def _in_turn_order(self) -> bool:
+        """Return True if events are already in sorted_events() order.
+
+        JSONL logs are normally written in turn order, so this cheap check
+        lets sorted_events() skip building sort keys in the common case.
+        """
+        prev_missing = False
+        prev_turn: Any = None
+        prev_ts = ""
+        for e in self.events:
+            turn = e.turn_sequence
+            ts = e.timestamp or ""
+            if turn is None:
+                if prev_missing and ts < prev_ts:
+                    return False
+                prev_missing = True
+            elif prev_missing:
+                return False
+            elif prev_turn is not None and (
+                turn < prev_turn or (turn == prev_turn and ts < prev_ts)
+            ):
+                return False
+            else:
+                prev_turn = turn
+            prev_ts = ts
+        return True
 
     def sorted_events(self) -> List[Event]:
         """Return events sorted by turn_sequence, then timestamp.
@@ -121,7 +241,16 @@ class SessionTrace:
         when facing partial or slightly malformed logs, this method also
         uses timestamp as a secondary key and places events without a
         turn_sequence after those that do have one.
+
+        The list is built once and shared by all callers; treat it as
+        read-only. It is always a separate list from ``events``.
         """
+        if self._sorted is not None:
+            return self._sorted
+
+        if self._in_turn_order():
+            self._sorted = list(self.events)
+            return self._sorted
 
         def _key(e: Event) -> Tuple[bool, int, str]:
             # Events with a missing turn_sequence are sorted last (True > False).
@@ -132,25 +261,30 @@ class SessionTrace:
             ts = e.timestamp or ""
             return (missing_turn, turn, ts)
 
-        return sorted(self.events, key=_key)
+        self._sorted = sorted(self.events, key=_key)
+        return self._sorted
 
     def lifecycle_events(self) -> List[Event]:
         """Events with a lifecycle phase (phase != 'none')."""
         return [e for e in self.events if e.phase and e.phase != "none"]
 
+    def lifecycle_count(self) -> int:
+        """Number of lifecycle events (see lifecycle_events)."""
+        flags = self._flags or self._compute_flags()
+        return flags.lifecycle_count
+
     def is_closed(self) -> bool:
         """Return True if this session has an explicit session_closed event.
 
         This is used to avoid treating incomplete (rolling) sessions as
         successfully resolved when computing PRDR / VRL / FR aggregates.
         """
-        return any(e.event_type == "session_closed" for e in self.events)
+        flags = self._flags or self._compute_flags()
+        return flags.closed
 
     def has_repair(self) -> bool:
-        return any(
-            e.event_type in ("repair_triggered", "repair_escalated")
-            for e in self.events
-        )
+        flags = self._flags or self._compute_flags()
+        return flags.has_repair
 
     def has_post_repair_drift(self) -> bool:
         """Return True if any drift occurs AFTER a repair in this session.
@@ -161,21 +295,27 @@ class SessionTrace:
         attempt to match taxonomy codes or drift domains; those would be
         separate, more granular metrics.
         """
-        events = self.sorted_events()
-        first_repair_turn: Optional[int] = None
-        for e in events:
-            if e.event_type in ("repair_triggered", "repair_escalated"):
-                first_repair_turn = e.turn_sequence
-                break
-
-        if first_repair_turn is None:
+        if not self.has_repair():
             return False
 
-        for e in events:
-            if (
-                e.event_type in ("drift_detected", "drift_escalated")
+        # Events are in turn order, so the first repair has the lowest repair
+        # turn and every drift with a higher turn comes after it: one pass
+        # is enough.
+        first_repair_turn: Optional[int] = None
+        seen_repair = False
+        for e in self.sorted_events():
+            etype = e.event_type
+            if not seen_repair:
+                if etype in _REPAIR_TYPES:
+                    first_repair_turn = e.turn_sequence
+                    if first_repair_turn is None:
+                        # Only turn-less repairs (sorted last); nothing follows.
+                        return False
+                    seen_repair = True
+            elif (
+                etype in _DRIFT_TYPES
                 and e.turn_sequence is not None
-                and e.turn_sequence > first_repair_turn
+                and e.turn_sequence > first_repair_turn  # type: ignore[operator]
             ):
                 return True
         return False
@@ -196,10 +336,20 @@ class SessionTrace:
                 events.append(e)
         return events
 
+    def failover_count(self) -> int:
+        """Number of failover events (see failover_events)."""
+        flags = self._flags or self._compute_flags()
+        return flags.failover_count
 
-@dataclass
+
+@dataclass(**_DATACLASS_OPTS)
 class MetricsSummary:
-    """Aggregated metrics across all sessions."""
+    """Aggregated metrics across all sessions.
+
+    The derived values (prdr_percent, vrl_mean_seconds, fr_ratio) are
+    computed once at construction; the summary is not meant to be mutated
+    afterwards.
+    """
 
     num_sessions: int
     prdr_sessions_with_repair: int
@@ -207,26 +357,20 @@ class MetricsSummary:
     vrl_samples_seconds: List[float] = field(default_factory=list)
     fr_failover_events: int = 0
     fr_lifecycle_events: int = 0
-
-    @property
-    def prdr_percent(self) -> Optional[float]:
-        if self.prdr_sessions_with_repair == 0:
-            return None
-        return 100.0 * (
-            self.prdr_sessions_with_post_repair_drift / self.prdr_sessions_with_repair
-        )
-
-    @property
-    def vrl_mean_seconds(self) -> Optional[float]:
-        if not self.vrl_samples_seconds:
-            return None
-        return mean(self.vrl_samples_seconds)
-
-    @property
-    def fr_ratio(self) -> Optional[float]:
-        if self.fr_lifecycle_events == 0:
-            return None
-        return self.fr_failover_events / self.fr_lifecycle_events
+    prdr_percent: Optional[float] = field(init=False, default=None)
+    vrl_mean_seconds: Optional[float] = field(init=False, default=None)
+    fr_ratio: Optional[float] = field(init=False, default=None)
+
+    def __post_init__(self) -> None:
+        if self.prdr_sessions_with_repair:
+            self.prdr_percent = 100.0 * (
+                self.prdr_sessions_with_post_repair_drift
+                / self.prdr_sessions_with_repair
+            )
+        if self.vrl_samples_seconds:
+            self.vrl_mean_seconds = mean(self.vrl_samples_seconds)
+        if self.fr_lifecycle_events:
+            self.fr_ratio = self.fr_failover_events / self.fr_lifecycle_events
 
 
 # ---------------------------------------------------------------------------
@@ -254,25 +398,63 @@ def _parse_iso8601(s: str) -> datetime:
     return dt.astimezone(timezone.utc)
 
 
+def _parse_iso8601_utc_naive(s: str) -> datetime:
+    """Parse a timestamp like _parse_iso8601, returned as a naive UTC datetime.
+
+    PLD runtimes emit ``YYYY-MM-DDTHH:MM:SS[.ffffff]Z``. For that exact shape
+    the 'Z' is dropped and the rest parsed as a naive datetime, which skips
+    building a tz-aware value and converting it back to UTC. Every other
+    input goes through _parse_iso8601, so accepted/rejected inputs and the
+    differences between parsed values are unchanged.
+    """
+    if (len(s) == 20 or len(s) == 27) and s[-1] == "Z":
+        dt = datetime.fromisoformat(s[:-1])
+        if dt.tzinfo is not None:
+            # "...+HHZ" and the like: rejected by _parse_iso8601 as well.
+            raise ValueError(f"Invalid isoformat string: {s!r}")
+        return dt
+    return _parse_iso8601(s).replace(tzinfo=None)
+
+
 # ---------------------------------------------------------------------------
 # IO & grouping
 # ---------------------------------------------------------------------------
 
 
-def load_events_from_jsonl(path: str) -> List[Event]:
-    """Load PLD events from a JSONL file.
+def _loads_line(raw: bytes) -> Any:
+    """Parse one JSONL line given as raw UTF-8 bytes.
+
+    orjson (when installed) parses the bytes directly. Anything it rejects is
+    re-parsed with the standard library, which accepts a few inputs orjson
+    does not (NaN/Infinity, integers beyond 64 bits) and produces the usual
+    json.JSONDecodeError messages for genuinely invalid lines.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(raw.decode("utf-8").strip())
+
+
+def iter_events_from_jsonl(path: str) -> Iterator[Event]:
+    """Yield PLD events from a JSONL file, one line at a time.
 
     Lines containing a metadata envelope ({"_meta": true, ...}) are skipped.
+    Events are produced as the file is read, so callers that consume them
+    directly (e.g. group_events_by_session) never hold a separate list of
+    all events.
     """
-    events: List[Event] = []
     try:
-        with open(path, "r", encoding="utf-8") as f:
+        # Read raw bytes: orjson parses UTF-8 directly, so lines are never
+        # decoded to str first.
+        with open(path, "rb") as f:
             for line_no, line in enumerate(f, start=1):
                 line = line.strip()
                 if not line:
                     continue
                 try:
-                    obj = json.loads(line)
+                    obj = _loads_line(line)
                 except json.JSONDecodeError as exc:
                     print(
                         f"[WARN] Skipping invalid JSON on line {line_no}: {exc}",
@@ -280,7 +462,9 @@ def load_events_from_jsonl(path: str) -> List[Event]:
                     )
                     continue
 
-                if isinstance(obj, Mapping) and obj.get("_meta"):
+                # JSON objects always decode to dict, so a plain dict check is
+                # enough (and far cheaper than the typing.Mapping ABC check).
+                if isinstance(obj, dict) and obj.get("_meta"):
                     # Treat metadata records as file-level metadata, not events.
                     continue
 
@@ -291,7 +475,7 @@ def load_events_from_jsonl(path: str) -> List[Event]:
                     )
                     continue
 
-                events.append(Event(raw=obj))
+                yield Event(raw=obj)
     except FileNotFoundError:
         print(f"[ERROR] File not found: {path}", file=sys.stderr)
         sys.exit(1)
@@ -299,7 +483,10 @@ def load_events_from_jsonl(path: str) -> List[Event]:
         print(f"[ERROR] Failed to read file {path}: {exc}", file=sys.stderr)
         sys.exit(1)
 
-    return events
+
+def load_events_from_jsonl(path: str) -> List[Event]:
+    """Load all PLD events from a JSONL file into a list."""
+    return list(iter_events_from_jsonl(path))
 
 
 def group_events_by_session(events: Iterable[Event]) -> Dict[str, SessionTrace]:
@@ -310,9 +497,10 @@ def group_events_by_session(events: Iterable[Event]) -> Dict[str, SessionTrace]:
         if not sid:
             # Ignore events without a session_id; they cannot participate in session metrics.
             continue
-        if sid not in sessions:
-            sessions[sid] = SessionTrace(session_id=sid)
-        sessions[sid].events.append(e)
+        trace = sessions.get(sid)
+        if trace is None:
+            trace = sessions[sid] = SessionTrace(session_id=sid)
+        trace.events.append(e)
     return sessions
 
 
@@ -379,7 +567,7 @@ def _compute_vrl_samples_for_session(session: SessionTrace) -> List[float]:
     for e in events:
         etype = e.event_type
 
-        if etype in ("drift_detected", "drift_escalated"):
+        if etype in _DRIFT_TYPES:
             # Start a new drift episode only if we are not already in one.
             if current_drift_event is None:
                 current_drift_event = e
@@ -387,7 +575,7 @@ def _compute_vrl_samples_for_session(session: SessionTrace) -> List[float]:
             # same episode and ignore for VRL start purposes.
             continue
 
-        if etype in ("continue_allowed", "reentry_observed"):
+        if etype in _RECOVERY_TYPES:
             # Candidate recovery event.
             if current_drift_event is None:
                 continue
@@ -398,8 +586,8 @@ def _compute_vrl_samples_for_session(session: SessionTrace) -> List[float]:
                 continue
 
             try:
-                t_drift = _parse_iso8601(current_drift_event.timestamp)
-                t_recovery = _parse_iso8601(e.timestamp)
+                t_drift = current_drift_event.parsed_timestamp()
+                t_recovery = e.parsed_timestamp()
             except Exception:
                 # If parsing fails, drop this episode and continue.
                 current_drift_event = None
@@ -459,19 +647,44 @@ def compute_fr(
         if not include_incomplete and not session.is_closed():
             continue
 
-        failover_events += len(session.failover_events())
-        lifecycle_events += len(session.lifecycle_events())
+        failover_events += session.failover_count()
+        lifecycle_events += session.lifecycle_count()
 
     return failover_events, lifecycle_events
 
 
-def compute_metrics_summary(session_map: Dict[str, SessionTrace]) -> MetricsSummary:
-    sessions = list(session_map.values())
-    num_sessions = len(sessions)
+def compute_all_metrics(
+    sessions: Iterable[SessionTrace],
+    *,
+    include_incomplete: bool = False,
+) -> MetricsSummary:
+    """Compute PRDR, VRL and FR aggregates in a single pass over sessions.
+
+    Produces the same numbers as compute_prdr, compute_vrl_samples and
+    compute_fr, but visits each session (and checks is_closed) only once.
+    num_sessions counts every session, including incomplete ones.
+    """
+    num_sessions = 0
+    prdr_den = 0
+    prdr_num = 0
+    vrl_samples: List[float] = []
+    fr_failover = 0
+    fr_lifecycle = 0
+
+    for session in sessions:
+        num_sessions += 1
+        if not include_incomplete and not session.is_closed():
+            continue
+
+        if session.has_repair():
+            prdr_den += 1
+            if session.has_post_repair_drift():
+                prdr_num += 1
+
+        vrl_samples.extend(_compute_vrl_samples_for_session(session))
 
-    prdr_den, prdr_num = compute_prdr(sessions)
-    vrl_samples = compute_vrl_samples(sessions)
-    fr_failover, fr_lifecycle = compute_fr(sessions)
+        fr_failover += session.failover_count()
+        fr_lifecycle += session.lifecycle_count()
 
     return MetricsSummary(
         num_sessions=num_sessions,
@@ -483,6 +696,10 @@ def compute_metrics_summary(session_map: Dict[str, SessionTrace]) -> MetricsSumm
     )
 
 
+def compute_metrics_summary(session_map: Dict[str, SessionTrace]) -> MetricsSummary:
+    return compute_all_metrics(session_map.values())
+
+
 # ---------------------------------------------------------------------------
 # Rendering
 # ---------------------------------------------------------------------------
@@ -518,6 +735,30 @@ def render_metrics_summary(metrics: MetricsSummary) -> str:
     return "\n".join(lines)
 
 
+_WRITE_CHUNK_CHARS = 1 << 16
+
+
+def write_chunks(chunks: Iterable[str]) -> None:
+    """Write rendered text to stdout in large batches.
+
+    print() per line means one write (and, on a terminal, one flush) per
+    line. Joining chunks into ~64 KiB batches keeps the number of writes
+    small without holding the whole report in memory.
+    """
+    write = sys.stdout.write
+    pending: List[str] = []
+    size = 0
+    for chunk in chunks:
+        pending.append(chunk)
+        size += len(chunk)
+        if size >= _WRITE_CHUNK_CHARS:
+            write("".join(pending))
+            pending.clear()
+            size = 0
+    if pending:
+        write("".join(pending))
+
+
 def render_session_summary(session: SessionTrace) -> str:
     events = session.sorted_events()
     lines: List[str] = []
@@ -537,25 +778,29 @@ def render_session_summary(session: SessionTrace) -> str:
         "-----+--------------------------+--------------------+-----------+----------------------"
     )
 
+    # Rows and the per-session counts come from the same pass.
+    drift_count = 0
+    repair_count = 0
+    cont_count = 0
+    append = lines.append
     for e in events:
         turn = e.turn_sequence if e.turn_sequence is not None else "-"
+        etype = e.event_type
         ts = (e.timestamp or "")[:26]  # trim for compact display
-        etype = (e.event_type or "")[:18]
         phase = (e.phase or "")[:9]
         code = (e.code or "")[:22]
-        lines.append(f"{turn:>4} | {ts:<24} | {etype:<18} | {phase:<9} | {code}")
+        append(
+            f"{turn:>4} | {ts:<24} | {(etype or '')[:18]:<18} | {phase:<9} | {code}"
+        )
+        if etype in _DRIFT_TYPES:
+            drift_count += 1
+        elif etype in _REPAIR_TYPES:
+            repair_count += 1
+        elif etype in _CONTINUE_TYPES:
+            cont_count += 1
 
     # Small per-session derived stats
-    drift_count = sum(
-        1 for e in events if e.event_type in ("drift_detected", "drift_escalated")
-    )
-    repair_count = sum(
-        1 for e in events if e.event_type in ("repair_triggered", "repair_escalated")
-    )
-    cont_count = sum(
-        1 for e in events if e.event_type in ("continue_allowed", "continue_blocked")
-    )
-    failover_count = len(session.failover_events())
+    failover_count = session.failover_count()
 
     lines.append("")
     lines.append(
@@ -609,17 +854,18 @@ def main(argv: Optional[List[str]] = None) -> int:
     parser = build_arg_parser()
     args = parser.parse_args(argv)
 
-    events = load_events_from_jsonl(args.file)
-    if not events:
+    # Load and group in a single streaming pass.
+    events = iter_events_from_jsonl(args.file)
+    first = next(events, None)
+    if first is None:
         print("[INFO] No events loaded; nothing to display.", file=sys.stderr)
         return 0
 
-    session_map = group_events_by_session(events)
+    session_map = group_events_by_session(itertools.chain((first,), events))
     metrics = compute_metrics_summary(session_map)
 
     # Metrics summary first
-    print(render_metrics_summary(metrics))
-    print("")
+    sys.stdout.write(render_metrics_summary(metrics) + "\n\n")
 
     if not args.no_sessions:
         if args.session:
@@ -629,12 +875,15 @@ def main(argv: Optional[List[str]] = None) -> int:
                     f"[WARN] No session found with id={args.session}", file=sys.stderr
                 )
             else:
-                print(render_session_summary(session))
+                sys.stdout.write(render_session_summary(session) + "\n")
         else:
-            # Print all sessions in sorted order
-            for sid in sorted(session_map.keys()):
-                print(render_session_summary(session_map[sid]))
-                print("")
+            # Print all sessions in sorted order. Each session is rendered only
+            # when its batch is written and is dropped from the map right
+            # away, so its events can be freed as the report streams out.
+            write_chunks(
+                render_session_summary(session_map.pop(sid)) + "\n\n"
+                for sid in sorted(session_map)
+            )
 
     return 0
 
@@ -8,10 +8,38 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+import threading
+from typing import Any, Dict, List, Optional
 
 from openai import OpenAI
 
+# One client (and its HTTP connection pool) shared by every AssistantNode in
+# the process, so rebuilding a graph does not open a new pool.
+_shared_client: Optional[OpenAI] = None
+_shared_client_lock = threading.Lock()
+
+
+def _get_client() -> OpenAI:
+    """Return the process-wide OpenAI client, creating it on first use."""
+    global _shared_client
+
+    if _shared_client is None:
+        with _shared_client_lock:
+            if _shared_client is None:
+                _shared_client = OpenAI()
+    return _shared_client
+
+
+def _extract_reply(response: Any) -> str:
+    """Return the first output_text of a Responses API result, if any."""
+    for item in response.output:
+        if item.type != "message":
+            continue
+        for c in item.content:
+            if getattr(c, "type", None) == "output_text":
+                return c.text.value
+    return "<no response>"
+
 
 class AssistantNode:
     """LangGraph node wrapper for the OpenAI Assistants-style chat API.
@@ -23,7 +51,7 @@ class AssistantNode:
     """
 
     def __init__(self, model: str, tools: List[Dict[str, Any]] | None = None) -> None:
-        self._client = OpenAI()
+        self._client = _get_client()
         self._model = model
         self._tools = tools or []
 
@@ -49,17 +77,8 @@ class AssistantNode:
 
         # Extract the assistant's reply text from the response.
         # This is intentionally defensive: we try to find the first text output.
-        assistant_reply = "<no response>"
         try:
-            for item in response.output:
-                if item.type == "message":
-                    for c in item.content:
-                        if getattr(c, "type", None) == "output_text":
-                            assistant_reply = c.text.value
-                            raise StopIteration
-            # Fallback: if structure differs, stringify the response
-        except StopIteration:
-            pass
+            assistant_reply = _extract_reply(response)
         except Exception:
             # As a last resort, stringify the response object
             assistant_reply = str(response)
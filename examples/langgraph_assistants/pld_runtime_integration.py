@@ -8,16 +8,21 @@
 
 from __future__ import annotations
 
+from collections import Counter
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional, Tuple, cast
 import logging
+import queue
+import threading
 
 # NOTE:
 # This example treats `pld_runtime` as the Level 5 API surface.
 # The package is expected to re-export the following symbols:
 #
 #   RuntimeSignalBridge, RuntimeSignal, SignalKind, EventContext, ValidationMode
-#   RuntimeLoggingPipeline, JsonlExporter
+#   RuntimeLoggingPipeline, JsonlExporter, JsonlExporterConfig
 #
 # If your repository uses a different public API module, adjust this import
 # accordingly (but keep the examples as consumers of the official API surface).
@@ -29,6 +34,7 @@ from pld_runtime import (
     ValidationMode,
     RuntimeLoggingPipeline,
     JsonlExporter,
+    JsonlExporterConfig,
 )
 
 logger = logging.getLogger(__name__)
@@ -43,6 +49,46 @@ logger = logging.getLogger(__name__)
 
 _bridge: Optional[RuntimeSignalBridge] = None
 _logging_pipeline: Optional[RuntimeLoggingPipeline] = None
+# Set once both singletons exist, so the per-emit check is a single load.
+_INITIALIZED = False
+# Set by shutdown_pld_observer(); emits after shutdown are dropped.
+_SHUT_DOWN = False
+
+# Optional background emission (see init_pld_observer(background=True)).
+# Items are (signal, context, timestamp); None tells the worker to stop.
+_EmitItem = Tuple[RuntimeSignal, EventContext, str]
+_emit_queue: Optional["queue.SimpleQueue[Optional[_EmitItem]]"] = None
+_emit_thread: Optional[threading.Thread] = None
+
+# Seconds shutdown_pld_observer waits for queued events to be processed.
+_SHUTDOWN_JOIN_TIMEOUT = 5.0
+
+# Config string -> ValidationMode. Unknown values fall back to STRICT.
+_VALIDATION_MODES: Mapping[str, ValidationMode] = MappingProxyType(
+    {
+        "strict": ValidationMode.STRICT,
+        "warn": ValidationMode.WARN,
+        "normalize": ValidationMode.NORMALIZE,
+    }
+)
+
+# Shared read-only payload for signals that carry no data. The bridge copies
+# signal.payload into each event, so one instance can back every signal.
+_EMPTY_PAYLOAD: Mapping[str, Any] = MappingProxyType({})
+
+# RuntimeSignal is frozen, so payload-less signals are built once per kind
+# and shared by every emit (and safely by the background queue).
+_EMPTY_SIGNALS: Dict[SignalKind, RuntimeSignal] = {
+    kind: RuntimeSignal(kind=kind, payload=_EMPTY_PAYLOAD) for kind in SignalKind
+}
+
+# Repeated skip/failure messages are logged on the 1st, 1025th, 2049th, ...
+# occurrence of each kind, so a misbehaving state cannot make logging the
+# dominant per-turn cost.
+_LOG_SAMPLE_MASK = 1023
+_log_counts: "Counter[str]" = Counter()
+# Counted from both the caller and the background worker thread.
+_log_counts_lock = threading.Lock()
 
 
 # ---------------------------------------------------------------------------
@@ -54,6 +100,7 @@ def init_pld_observer(
     *,
     jsonl_path: str,
     validation_mode: str = "strict",
+    background: bool = False,
 ) -> None:
     """Initialize the PLD observer stack (bridge + logging pipeline).
 
@@ -65,15 +112,19 @@ def init_pld_observer(
         - Constructs a RuntimeSignalBridge with the requested ValidationMode.
         - Constructs a RuntimeLoggingPipeline with a JsonlExporter targeting
           jsonl_path.
+        - If background is True, starts a daemon thread that builds and
+          records events; emit_* calls then only validate the state and
+          enqueue, keeping event construction off the LangGraph turn.
 
     Design notes:
         - This function is idempotent; repeated calls are logged but safe.
         - This module is "observer-only": initialization failure should be
           treated as a logging concern, not as a fatal application error.
     """
-    global _bridge, _logging_pipeline
+    global _bridge, _logging_pipeline, _emit_queue, _emit_thread
+    global _INITIALIZED, _SHUT_DOWN
 
-    if _bridge is not None and _logging_pipeline is not None:
+    if _INITIALIZED:
         # Already initialized; be idempotent.
         logger.debug("PLD observer already initialized, skipping re-init")
         return
@@ -83,22 +134,32 @@ def init_pld_observer(
 
     # Map string -> ValidationMode enum safely.
     mode_normalized = (validation_mode or "strict").lower()
-    if mode_normalized == "warn":
-        vm = ValidationMode.WARN
-    elif mode_normalized == "normalize":
-        vm = ValidationMode.NORMALIZE
-    else:
-        vm = ValidationMode.STRICT
+    vm = _VALIDATION_MODES.get(mode_normalized, ValidationMode.STRICT)
 
     _bridge = RuntimeSignalBridge(validation_mode=vm)
 
-    exporter = JsonlExporter(path=path)
+    exporter = JsonlExporter.from_config(JsonlExporterConfig(path=path))
     _logging_pipeline = RuntimeLoggingPipeline(jsonl_exporter=exporter)
 
+    if background:
+        _emit_queue = queue.SimpleQueue()
+        _emit_thread = threading.Thread(
+            target=_drain_emit_queue,
+            args=(_emit_queue, _bridge, _logging_pipeline),
+            name="pld-observer-emit",
+            daemon=True,
+        )
+        _emit_thread.start()
+
+    _INITIALIZED = True
+    _SHUT_DOWN = False
+
     logger.info(
-        "Initialized PLD observer (observer-only): validation_mode=%s, jsonl_path=%s",
+        "Initialized PLD observer (observer-only): validation_mode=%s, jsonl_path=%s, "
+        "background=%s",
         vm.value,
         str(path),
+        background,
     )
 
 
@@ -106,6 +167,9 @@ def shutdown_pld_observer() -> None:
     """Flush and close logging resources (optional, but recommended).
 
     This is a convenience wrapper around RuntimeLoggingPipeline.close().
+    In background mode the worker drains its queue and closes the pipeline
+    itself, so the pipeline is never closed while events are still being
+    recorded into it.
 
     Design intent:
         - Safe to call from a finally-block in run.py.
@@ -113,9 +177,11 @@ def shutdown_pld_observer() -> None:
           They are logged as errors but not re-raised.
 
     Forgetting to call this is not fatal, but some of the last events
-    may not be written to disk.
+    may not be written to disk. emit_* calls made after shutdown are
+    dropped until init_pld_observer(...) is called again.
     """
-    global _logging_pipeline
+    global _logging_pipeline, _emit_queue, _emit_thread
+    global _INITIALIZED, _SHUT_DOWN
 
     if not _ensure_initialized():
         # If we were never initialized, there's nothing to shut down.
@@ -123,12 +189,31 @@ def shutdown_pld_observer() -> None:
 
     assert _logging_pipeline is not None
 
-    try:
-        _logging_pipeline.close()
-        logger.info("PLD observer shutdown complete (logging pipeline closed)")
-    except Exception:
-        # Observer failures must NOT break the main application flow.
-        logger.exception("Failed to shutdown PLD observer cleanly")
+    # Reject new emits before draining, so nothing is queued behind the
+    # stop sentinel or recorded into a closed pipeline.
+    _INITIALIZED = False
+    _SHUT_DOWN = True
+
+    if _emit_queue is None or _emit_thread is None:
+        _close_pipeline(_logging_pipeline)
+        return
+
+    # Let the worker finish everything queued so far; it closes the pipeline
+    # once it reaches the stop sentinel.
+    emit_queue, emit_thread = _emit_queue, _emit_thread
+    _emit_queue = None
+    _emit_thread = None
+    emit_queue.put(None)
+    emit_thread.join(timeout=_SHUTDOWN_JOIN_TIMEOUT)
+    if emit_thread.is_alive():
+        # qsize() still counts the stop sentinel.
+        logger.error(
+            "PLD emit worker did not finish within %.1fs; left it running "
+            "with about %d queued events. It closes the logging pipeline when "
+            "done, unless the process exits first.",
+            _SHUTDOWN_JOIN_TIMEOUT,
+            max(emit_queue.qsize() - 1, 0),
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -148,7 +233,7 @@ def emit_continue_event(state: Dict[str, Any]) -> None:
         state=state,
         kind=SignalKind.CONTINUE_NORMAL,
         current_phase="continue",
-        payload={},
+        payload=_EMPTY_PAYLOAD,
     )
 
 
@@ -180,7 +265,7 @@ def emit_session_closed(state: Dict[str, Any]) -> None:
         state=state,
         kind=SignalKind.SESSION_CLOSED,
         current_phase="outcome",
-        payload={},
+        payload=_EMPTY_PAYLOAD,
     )
 
 
@@ -197,33 +282,62 @@ def _ensure_initialized() -> bool:
 
     Policy:
         - This function never raises.
-        - If uninitialized, it logs a warning and returns False.
+        - If uninitialized or shut down, it logs a (sampled) warning and
+          returns False.
         - Callers should treat False as a "no-op" condition for PLD logging.
     """
-    if _bridge is None or _logging_pipeline is None:
-        logger.warning(
-            "PLD observer has not been initialized. "
-            "Call init_pld_observer(...) in your entry point before emitting events."
-        )
+    if not _INITIALIZED:
+        if _SHUT_DOWN:
+            if _should_log("shut_down"):
+                logger.warning(
+                    "PLD observer has been shut down; ignoring PLD call."
+                )
+        elif _should_log("uninitialized"):
+            logger.warning(
+                "PLD observer has not been initialized. "
+                "Call init_pld_observer(...) in your entry point before emitting events."
+            )
         return False
     return True
 
 
+def _should_log(key: str) -> bool:
+    """Count one occurrence of `key`; True if this occurrence should be logged."""
+    with _log_counts_lock:
+        n = _log_counts[key]
+        _log_counts[key] = n + 1
+    return n & _LOG_SAMPLE_MASK == 0
+
+
+def _close_pipeline(pipeline: RuntimeLoggingPipeline) -> None:
+    """Close the logging pipeline, logging (not raising) any failure."""
+    try:
+        pipeline.close()
+        logger.info("PLD observer shutdown complete (logging pipeline closed)")
+    except Exception:
+        # Observer failures must NOT break the main application flow.
+        logger.exception("Failed to shutdown PLD observer cleanly")
+
+
 def _emit_signal(
     *,
     state: Dict[str, Any],
     kind: SignalKind,
     current_phase: str,
-    payload: Optional[Dict[str, Any]] = None,
+    payload: Optional[Mapping[str, Any]] = None,
 ) -> None:
     """Common logic for emitting PLD events from a LangGraph state.
 
     Responsibilities:
         - Extract session_id, turn, model from the LangGraph state.
-        - Construct RuntimeSignal and EventContext.
+        - Construct (or reuse a shared payload-less) RuntimeSignal, and an
+          EventContext.
         - Use RuntimeSignalBridge.build_event(...) to obtain a PLD-compliant
           event dict.
         - Forward that event dict to the RuntimeLoggingPipeline.
+        - In background mode, only the state checks happen here; the signal
+          (with a copy of the payload), context and emit timestamp are
+          queued for the worker thread.
 
     Constraints:
         - PLD event dicts are NEVER manually constructed here.
@@ -234,39 +348,46 @@ def _emit_signal(
 
     Failure policy (observer-only):
         - If required keys are missing in state, log a warning and skip emission.
-        - If build_event(...) or logging fails, log an exception and continue.
+        - If build_event(...) or logging fails, log an error and continue.
+        - Both are sampled per kind (see _LOG_SAMPLE_MASK); tracebacks are
+          only logged when DEBUG is enabled.
         - LangGraph agent behavior is never blocked by PLD logging failures.
     """
     if not _ensure_initialized():
         return
 
-    assert _bridge is not None
-    assert _logging_pipeline is not None
-
     try:
         session_id = state["session_id"]
         turn_sequence = state["turn"]
         model = state.get("model")
     except KeyError as exc:
-        logger.warning(
-            "Missing required key in state for PLD emission (%s). "
-            "Skipping PLD event.",
-            exc,
-        )
+        if _should_log("missing_key"):
+            logger.warning(
+                "Missing required key in state for PLD emission (%s). "
+                "Skipping PLD event.",
+                exc,
+            )
         return
 
     if not isinstance(turn_sequence, int) or turn_sequence < 1:
-        logger.warning(
-            "Invalid turn_sequence in state: %r (must be 1-based integer). "
-            "Skipping PLD event.",
-            turn_sequence,
-        )
+        if _should_log("invalid_turn"):
+            logger.warning(
+                "Invalid turn_sequence in state: %r (must be 1-based integer). "
+                "Skipping PLD event.",
+                turn_sequence,
+            )
         return
 
-    signal = RuntimeSignal(
-        kind=kind,
-        payload=payload or {},
-    )
+    emit_queue = _emit_queue
+
+    if payload:
+        if emit_queue is not None:
+            # The worker builds the event later; snapshot the payload now so
+            # later changes by the caller do not leak into the event.
+            payload = dict(payload)
+        signal = RuntimeSignal(kind=kind, payload=payload)
+    else:
+        signal = _EMPTY_SIGNALS[kind]
 
     context = EventContext(
         session_id=session_id,
@@ -276,15 +397,69 @@ def _emit_signal(
         current_phase=current_phase,
     )
 
+    if emit_queue is not None:
+        # Background mode: stamp the event time now, build it on the worker.
+        timestamp = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+        emit_queue.put((signal, context, timestamp))
+        return
+
+    # Only reached once initialized; cast() narrows the types at no runtime cost.
+    _build_and_record(
+        cast(RuntimeSignalBridge, _bridge),
+        cast(RuntimeLoggingPipeline, _logging_pipeline),
+        signal,
+        context,
+    )
+
+
+def _build_and_record(
+    bridge: RuntimeSignalBridge,
+    pipeline: RuntimeLoggingPipeline,
+    signal: RuntimeSignal,
+    context: EventContext,
+    timestamp: Optional[str] = None,
+) -> None:
+    """Build one PLD event via the bridge and hand it to the logging pipeline.
+
+    Used directly by _emit_signal, or by the background worker. Never raises.
+    """
     try:
         # Build PLD-compliant event dict via Level 5 API.
-        event = _bridge.build_event(signal=signal, context=context)
+        event = bridge.build_event(
+            signal=signal, context=context, timestamp_override=timestamp
+        )
 
         # IMPORTANT: event is treated as immutable after this point.
-        _logging_pipeline.on_event(event)
+        pipeline.on_event(event)
 
-    except Exception:
+    except Exception as exc:
         # IMPORTANT:
         #   This module is an observer. It must NEVER break the main LangGraph
         #   flow. Errors here are logged for investigation but not propagated.
-        logger.exception("Failed to emit PLD event for signal kind=%s", kind)
+        if not _should_log("emit_failed"):
+            return
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.exception("Failed to emit PLD event for signal kind=%s", signal.kind)
+        else:
+            logger.error(
+                "Failed to emit PLD event for signal kind=%s: %r", signal.kind, exc
+            )
+
+
+def _drain_emit_queue(
+    q: "queue.SimpleQueue[Optional[_EmitItem]]",
+    bridge: RuntimeSignalBridge,
+    pipeline: RuntimeLoggingPipeline,
+) -> None:
+    """Background worker: build and record queued events in FIFO order.
+
+    The worker only uses the bridge and pipeline it was started with, so a
+    later init_pld_observer(...) never receives its events. On the stop
+    sentinel it closes that pipeline.
+    """
+    while True:
+        item = q.get()
+        if item is None:
+            _close_pipeline(pipeline)
+            return
+        _build_and_record(bridge, pipeline, *item)
@@ -37,9 +37,14 @@ from examples.langgraph_assistants.pld_runtime_integration import (  # noqa: E40
 )
 
 
+# Use PyYAML's libyaml-backed safe loader when it was built with libyaml;
+# it parses the same documents as yaml.SafeLoader, only faster.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
 def load_config() -> Dict[str, Any]:
     cfg_path = Path(__file__).parent / "config.yaml"
-    return yaml.safe_load(cfg_path.read_text())
+    return yaml.load(cfg_path.read_text(), Loader=_YAML_LOADER)
 
 
 def main() -> None:
@@ -52,9 +57,14 @@ def main() -> None:
     model = cfg["model"]
     pld_mode = cfg.get("pld_validation_mode", "strict")
     jsonl_path = cfg.get("logging", {}).get("jsonl_path", "logs/langgraph_pld_demo.jsonl")
+    background_emit = bool(cfg.get("logging", {}).get("background_emit", False))
 
     # Initialize PLD observer stack (bridge + logging pipeline).
-    init_pld_observer(jsonl_path=jsonl_path, validation_mode=pld_mode)
+    init_pld_observer(
+        jsonl_path=jsonl_path,
+        validation_mode=pld_mode,
+        background=background_emit,
+    )
 
     # Build LangGraph application.
     app = build_graph(model=model)
@@ -88,8 +98,9 @@ def main() -> None:
                 print(f"[warn] Encountered error during assistant turn: {exc!r}")
                 break
 
-            # Increment the turn counter on the state (1-based).
-            state["turn"] = int(state.get("turn", 1)) + 1
+            # Increment the turn counter on the state (1-based). The initial
+            # state seeds it as an int and the graph passes it through.
+            state["turn"] += 1
 
         # Emit a 'session_closed' observer event at the end of the conversation.
         emit_session_closed(state)
@@ -21,11 +21,20 @@ Improvements:
 """
 
 import json
+import os
 import uuid
 import hashlib
 import random
-from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+import sys
+import threading
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
 
 # =============================================================================
 # Configuration
@@ -50,47 +59,116 @@ class Config:
 # Utility Functions
 # =============================================================================
 
+_RANDOM_BLOCK_BATCH = 4096
+
+def _random_blocks() -> Iterator[bytes]:
+    """Yield 16-byte random blocks, drawing entropy in batches of _RANDOM_BLOCK_BATCH"""
+    while True:
+        buf = os.urandom(16 * _RANDOM_BLOCK_BATCH)
+        for i in range(0, len(buf), 16):
+            yield buf[i:i + 16]
+
+def _random_hex_blocks() -> Iterator[str]:
+    """Yield 32-char random HEX strings, hex-encoding a whole batch at once"""
+    while True:
+        buf = os.urandom(16 * _RANDOM_BLOCK_BATCH).hex()
+        for i in range(0, len(buf), 32):
+            yield buf[i:i + 32]
+
+_RANDOM_BLOCKS = _random_blocks()
+_RANDOM_HEX_BLOCKS = _random_hex_blocks()
+# A generator cannot be resumed from two threads at once.
+_RANDOM_BLOCKS_LOCK = threading.Lock()
+_RANDOM_HEX_BLOCKS_LOCK = threading.Lock()
+
+def _next_random_block() -> bytes:
+    """Return the next 16-byte random block (safe to call from any thread)"""
+    with _RANDOM_BLOCKS_LOCK:
+        return next(_RANDOM_BLOCKS)
+
+def _next_random_hex() -> str:
+    """Return the next 32-char random HEX block (safe to call from any thread)"""
+    with _RANDOM_HEX_BLOCKS_LOCK:
+        return next(_RANDOM_HEX_BLOCKS)
+
 def generate_random_hex(length: int = 16) -> str:
-    """Generate completely random HEX string"""
-    return uuid.uuid4().hex[:length]
+    """Generate completely random HEX string (up to 32 chars)"""
+    return _next_random_hex()[:length]
 
 def generate_trace_id() -> str:
-    """Generate 32-char UUIDv4 (no hyphens)"""
-    return uuid.uuid4().hex
+    """Generate 32-char random HEX trace ID"""
+    return _next_random_hex()
+
+@lru_cache(maxsize=1024)
+def _utf8(text: str) -> bytes:
+    """UTF-8 encode a text input that recurs across sessions (e.g. the prompt)"""
+    return text.encode("utf-8")
+
+def _content_bytes(content: Any) -> bytes:
+    """Serialize hash input to bytes (dicts as key-sorted JSON, bytes as-is)"""
+    if isinstance(content, bytes):
+        return content
+    if isinstance(content, dict):
+        if orjson is not None:
+            # OPT_NON_STR_KEYS: json.dumps stringifies int/float/bool keys.
+            return orjson.dumps(
+                content, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+            )
+        return json.dumps(content, sort_keys=True).encode()
+    return str(content).encode()
 
 def calc_hash(content: Any) -> str:
     """Calculate actual SHA-256 hash"""
-    salt = uuid.uuid4().hex
-    if isinstance(content, dict):
-        content_str = json.dumps(content, sort_keys=True)
-    else:
-        content_str = str(content)
-    return hashlib.sha256((content_str + salt).encode()).hexdigest()
+    salt = _next_random_block()
+    return hashlib.sha256(_content_bytes(content) + salt).hexdigest()
 
 def calc_md5(content: Any) -> str:
     """Calculate MD5 hash (for short digests)"""
-    salt = uuid.uuid4().hex
-    if isinstance(content, dict):
-        content_str = json.dumps(content, sort_keys=True)
-    else:
-        content_str = str(content)
-    return hashlib.md5((content_str + salt).encode()).hexdigest()
+    salt = _next_random_block()
+    return hashlib.md5(_content_bytes(content) + salt).hexdigest()
+
+_EPOCH = datetime(1970, 1, 1)
+_ONE_US = timedelta(microseconds=1)
+# One-entry caches: the base time of the current trace, and the formatted
+# "YYYY-MM-DDTHH:MM:SS" prefix of the last second seen. Consecutive events
+# are milliseconds apart, so most timestamps reuse the same prefix.
+_BASE_US_CACHE: Tuple[Optional[datetime], int] = (None, 0)
+_TS_PREFIX_CACHE: Tuple[Optional[int], str] = (None, "")
 
-def get_time_with_jitter(base_time: datetime, offset_ms: float, jitter_range_us: int = 500) -> str:
+def _format_timestamp_us(t_us: int) -> str:
+    """Format microseconds since the epoch as YYYY-MM-DDTHH:MM:SS.ffffffZ"""
+    global _TS_PREFIX_CACHE
+    sec, us = divmod(t_us, 1_000_000)
+    cached_sec, prefix = _TS_PREFIX_CACHE
+    if sec != cached_sec:
+        prefix = (_EPOCH + timedelta(seconds=sec)).strftime("%Y-%m-%dT%H:%M:%S")
+        _TS_PREFIX_CACHE = (sec, prefix)
+    return f"{prefix}.{us:06d}Z"
+
+def get_time_with_jitter(base_time: datetime, offset_us: int, jitter_range_us: int = 500) -> str:
     """
     Generate timestamp with microsecond-level jitter
     
     Args:
-        base_time: Base timestamp
-        offset_ms: Offset in milliseconds
+        base_time: Base timestamp (naive UTC; tz-aware values are converted to UTC)
+        offset_us: Offset in microseconds
         jitter_range_us: Jitter range in microseconds (±)
     """
-    # Add jitter in microseconds
-    jitter_us = random.randint(-jitter_range_us, jitter_range_us)
-    total_us = int(offset_ms * 1000) + jitter_us
-    
-    t = base_time + timedelta(microseconds=total_us)
-    return t.strftime("%Y-%m-%dT%H:%M:%S.%f") + "Z"
+    global _BASE_US_CACHE
+    # Add jitter in microseconds. Uniform over [-range, +range] like
+    # random.randint, but a single C-level random() draw per event.
+    jitter_us = int(random.random() * (2 * jitter_range_us + 1)) - jitter_range_us
+    total_us = offset_us + jitter_us
+
+    cached_base, base_us = _BASE_US_CACHE
+    if cached_base != base_time:
+        naive = base_time
+        if naive.tzinfo is not None:
+            # The output carries a "Z" suffix, so render the UTC instant.
+            naive = naive.astimezone(timezone.utc).replace(tzinfo=None)
+        base_us = (naive - _EPOCH) // _ONE_US
+        _BASE_US_CACHE = (base_time, base_us)
+    return _format_timestamp_us(base_us + total_us)
 
 def add_gc_spike(base_latency: float) -> float:
     """Simulate latency increase due to GC spike"""
@@ -100,7 +178,6 @@ def add_gc_spike(base_latency: float) -> float:
 
 def generate_realistic_latency(base: float, variance_pct: float = 0.15) -> float:
     """Generate realistic latency distribution (normal distribution based)"""
-    import math
     # Log-normal-like distribution (closer to actual latency)
     mean = base
     std = base * variance_pct
@@ -115,10 +192,10 @@ def generate_realistic_latency(base: float, variance_pct: float = 0.15) -> float
 class RealisticLogGenerator:
     def __init__(self):
         self.trace_id = generate_trace_id()
-        self.session_id = str(uuid.uuid4())
+        self.session_id = str(uuid.UUID(bytes=_next_random_block(), version=4))
         self.base_time = datetime(2025, 11, 30, 10, 0, 1, random.randint(100000, 300000))
         self.events: List[Dict[str, Any]] = []
-        self.current_offset_ms = 0.0
+        self.current_offset_us = 0
         self.env = random.choice(Config.ENVIRONMENTS)
         self.agent_version = random.choice(Config.AGENT_VERSIONS)
         
@@ -135,10 +212,10 @@ class RealisticLogGenerator:
                    latency_ms: Optional[float] = None) -> str:
         """Add event and return span_id"""
         if latency_ms is not None:
-            self.current_offset_ms += latency_ms
+            self.current_offset_us += round(latency_ms * 1000)
         
         event = {
-            "timestamp": get_time_with_jitter(self.base_time, self.current_offset_ms),
+            "timestamp": get_time_with_jitter(self.base_time, self.current_offset_us),
             "trace_id": self.trace_id,
             "span_id": span_id,
             "component": component,
@@ -211,14 +288,16 @@ class RealisticLogGenerator:
     def generate_user_interaction(self, user_content: str):
         """2. User input"""
         latency = generate_realistic_latency(40, 0.2)
+        # Encoding is cached; the hash is not, since each session gets a new salt.
+        content_bytes = _utf8(user_content)
         self._add_event(
             span_id=generate_random_hex(),
             component="user",
             event_type="interaction",
             phase="input",
             payload={
-                "content_hash": calc_hash(user_content),
-                "content_len_bytes": len(user_content.encode('utf-8')),
+                "content_hash": calc_hash(content_bytes),
+                "content_len_bytes": len(content_bytes),
                 "content_preview": user_content[:20] + "...",
                 "input_type": "text",
                 "locale": "en-US"
@@ -493,7 +572,7 @@ class RealisticLogGenerator:
         
         payload = {
             "item_count": item_count,
-            "data_hash": calc_md5(f"results_{uuid.uuid4()}")
+            "data_hash": calc_md5(f"results_{generate_trace_id()}")
         }
         
         if partial_failure:
@@ -591,14 +670,19 @@ class RealisticLogGenerator:
 # Main Execution
 # =============================================================================
 
+# Reused for every line: json.dumps(..., ensure_ascii=False) builds a new
+# JSONEncoder per call. Kept on the stdlib encoder (not orjson) so the output
+# keeps the ", " / ": " separators of the published reference traces.
+_JSONL_ENCODER = json.JSONEncoder(ensure_ascii=False)
+
 def main():
     user_content = "Find me a cheap hotel in the city center with parking and free WiFi"
     
     generator = RealisticLogGenerator()
     logs = generator.generate(user_content)
     
-    for log in logs:
-        print(json.dumps(log, ensure_ascii=False))
+    encode = _JSONL_ENCODER.encode
+    sys.stdout.write("".join([encode(log) + "\n" for log in logs]))
 
 
 if __name__ == "__main__":
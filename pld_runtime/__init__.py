@@ -33,7 +33,7 @@ from .detection.runtime_signal_bridge import (
 # Level 5 — Logging Surface
 # -------------------------
 from .logging.runtime_logging_pipeline import RuntimeLoggingPipeline
-from .logging.exporters.exporter_jsonl import JsonlExporter
+from .logging.exporters.exporter_jsonl import JsonlExporter, JsonlExporterConfig
 from .logging.structured_logger import StructuredLogger
 
 
@@ -48,6 +48,7 @@ __all__ = [
     # Logging
     "RuntimeLoggingPipeline",
     "JsonlExporter",
+    "JsonlExporterConfig",
     "StructuredLogger",
 ]
 
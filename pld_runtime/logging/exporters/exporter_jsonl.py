@@ -178,6 +178,9 @@ class JsonlExporter:
         #  - We do not reorder or filter events here.
         #  - Ordering responsibility lies with the caller (e.g., SessionTraceBuffer).
         with self._lock:
+            # Serialize the whole batch first and hand it to the file in a
+            # single write() instead of one write per line.
+            lines = []
             for event in events:
                 payload: Mapping[str, Any]
                 if envelope_builder is None:
@@ -187,12 +190,17 @@ class JsonlExporter:
                     # original event without modifying it.
                     payload = envelope_builder(event)
 
-                line = json.dumps(
-                    payload,
-                    separators=(",", ":"),  # compact; do not sort keys
-                    ensure_ascii=False,
+                lines.append(
+                    json.dumps(
+                        payload,
+                        separators=(",", ":"),  # compact; do not sort keys
+                        ensure_ascii=False,
+                    )
                 )
-                self._file.write(line + "\n")
+                lines.append("\n")
+
+            if lines:
+                self._file.write("".join(lines))
 
             if auto_flush:
                 self._file.flush()
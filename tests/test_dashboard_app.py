@@ -0,0 +1,210 @@
+import importlib.util
+import os
+import sys
+
+import pytest
+
+# ---------------------------------------------------------
+# Load the dashboard example script directly from its path;
+# it is a standalone script, not part of an installed package.
+# ---------------------------------------------------------
+_SCRIPT = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "examples", "dashboard", "app.py")
+)
+_spec = importlib.util.spec_from_file_location("dashboard_app", _SCRIPT)
+app = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = app
+_spec.loader.exec_module(app)
+
+
+def _event(
+    turn,
+    ts,
+    event_type="continue_allowed",
+    phase="continue",
+    code="C0_normal",
+    session_id="s1",
+):
+    raw = {
+        "session_id": session_id,
+        "event_type": event_type,
+        "pld": {"phase": phase, "code": code},
+        "timestamp": ts,
+    }
+    if turn is not None:
+        raw["turn_sequence"] = turn
+    return app.Event(raw)
+
+
+def test_sorted_events_in_order_returns_separate_list():
+    trace = app.SessionTrace("s1", [
+        _event(1, "2025-01-01T00:00:01Z"),
+        _event(2, "2025-01-01T00:00:02Z"),
+    ])
+
+    result = trace.sorted_events()
+    assert result == trace.events
+    assert result is not trace.events
+
+    result.pop()
+    assert len(trace.events) == 2
+
+
+def test_sorted_events_out_of_order_sorts_by_turn_then_timestamp():
+    late = _event(None, "2025-01-01T00:00:00Z")
+    second_b = _event(2, "2025-01-01T00:00:05Z")
+    second_a = _event(2, "2025-01-01T00:00:03Z")
+    first = _event(1, "2025-01-01T00:00:09Z")
+    trace = app.SessionTrace("s1", [late, second_b, first, second_a])
+
+    assert trace.sorted_events() == [first, second_a, second_b, late]
+
+
+def test_sorted_events_fast_path_matches_keyed_sort():
+    in_order = [
+        _event(1, "2025-01-01T00:00:01Z"),
+        _event(1, "2025-01-01T00:00:02Z"),
+        _event(3, "2025-01-01T00:00:00Z"),
+        _event(None, "2025-01-01T00:00:04Z"),
+        _event(None, "2025-01-01T00:00:05Z"),
+    ]
+    trace = app.SessionTrace("s1", list(in_order))
+    assert trace._in_turn_order()
+    assert trace.sorted_events() == in_order
+
+    swapped = [in_order[1], in_order[0]] + in_order[2:]
+    trace = app.SessionTrace("s1", swapped)
+    assert not trace._in_turn_order()
+    assert trace.sorted_events() == in_order
+
+
+def test_event_equality_compares_raw_and_is_unhashable():
+    a = _event(1, "2025-01-01T00:00:01Z")
+    assert a == _event(1, "2025-01-01T00:00:01Z")
+    assert a != _event(2, "2025-01-01T00:00:01Z")
+    assert a != a.raw
+    with pytest.raises(TypeError):
+        hash(a)
+
+
+def test_event_with_non_dict_pld_has_no_phase_or_code():
+    e = app.Event({"session_id": "s1", "event_type": "continue_allowed", "pld": "x"})
+    assert (e.phase, e.code) == (None, None)
+
+
+def _session(session_id, *specs):
+    events = [
+        _event(turn, ts, event_type=event_type, phase=phase, session_id=session_id)
+        for turn, ts, event_type, phase in specs
+    ]
+    return app.SessionTrace(session_id, events)
+
+
+def _metric_sessions():
+    return [
+        # Closed: drift, repair, recovery, then drift again after the repair.
+        _session(
+            "closed-1",
+            (1, "2025-01-01T00:00:00Z", "drift_detected", "drift"),
+            (2, "2025-01-01T00:00:02Z", "repair_triggered", "repair"),
+            (3, "2025-01-01T00:00:05Z", "continue_allowed", "continue"),
+            (4, "2025-01-01T00:00:06Z", "drift_detected", "drift"),
+            (5, "2025-01-01T00:00:09Z", "failover_triggered", "failover"),
+            (6, "2025-01-01T00:00:10Z", "session_closed", "none"),
+        ),
+        # Closed: repair with no later drift.
+        _session(
+            "closed-2",
+            (1, "2025-01-01T00:01:00Z", "drift_detected", "drift"),
+            (2, "2025-01-01T00:01:01.500000Z", "repair_triggered", "repair"),
+            (3, "2025-01-01T00:01:04Z", "reentry_observed", "reentry"),
+            (4, "2025-01-01T00:01:05Z", "session_closed", "none"),
+        ),
+        # Incomplete: no session_closed.
+        _session(
+            "open",
+            (1, "2025-01-01T00:02:00Z", "drift_detected", "drift"),
+            (2, "2025-01-01T00:02:01Z", "repair_triggered", "repair"),
+            (3, "2025-01-01T00:02:03Z", "drift_detected", "drift"),
+            (4, "2025-01-01T00:02:07Z", "continue_allowed", "continue"),
+        ),
+    ]
+
+
+@pytest.mark.parametrize("include_incomplete", [False, True])
+def test_compute_all_metrics_matches_separate_metrics(include_incomplete):
+    sessions = _metric_sessions()
+    summary = app.compute_all_metrics(sessions, include_incomplete=include_incomplete)
+
+    repair, post_repair_drift = app.compute_prdr(
+        _metric_sessions(), include_incomplete=include_incomplete
+    )
+    failover, lifecycle = app.compute_fr(
+        _metric_sessions(), include_incomplete=include_incomplete
+    )
+    assert summary.num_sessions == 3
+    assert summary.prdr_sessions_with_repair == repair
+    assert summary.prdr_sessions_with_post_repair_drift == post_repair_drift
+    assert summary.vrl_samples_seconds == app.compute_vrl_samples(
+        _metric_sessions(), include_incomplete=include_incomplete
+    )
+    assert summary.fr_failover_events == failover
+    assert summary.fr_lifecycle_events == lifecycle
+
+
+def test_compute_all_metrics_skips_incomplete_sessions_by_default():
+    summary = app.compute_all_metrics(_metric_sessions())
+
+    assert summary.prdr_sessions_with_repair == 2
+    assert summary.prdr_sessions_with_post_repair_drift == 1
+    assert summary.vrl_samples_seconds == [5.0, 4.0]
+    assert (summary.fr_failover_events, summary.fr_lifecycle_events) == (1, 8)
+
+
+@pytest.mark.parametrize(
+    "ts",
+    [
+        "2025-01-01T00:00:01Z",
+        "2025-01-01T00:00:01.123456Z",
+        "2025-01-01T00:00:01.5Z",
+        "2025-01-01T09:00:01+09:00",
+        "2025-01-01T00:00:01",
+    ],
+)
+def test_parse_iso8601_utc_naive_matches_aware_parser(ts):
+    expected = app._parse_iso8601(ts).replace(tzinfo=None)
+    assert app._parse_iso8601_utc_naive(ts) == expected
+
+
+@pytest.mark.parametrize("ts", ["2025-01-01T00:00+09Z", "2025-01-01T00:00:01+09Z", ""])
+def test_parse_iso8601_utc_naive_rejects_what_aware_parser_rejects(ts):
+    with pytest.raises(ValueError):
+        app._parse_iso8601(ts)
+    with pytest.raises(ValueError):
+        app._parse_iso8601_utc_naive(ts)
+
+
+def test_has_post_repair_drift():
+    assert _session(
+        "s1",
+        (1, "2025-01-01T00:00:00Z", "repair_triggered", "repair"),
+        (2, "2025-01-01T00:00:01Z", "drift_detected", "drift"),
+    ).has_post_repair_drift()
+
+    # Same-turn drift, turn-less drift and no repair at all do not count.
+    assert not _session(
+        "s1",
+        (2, "2025-01-01T00:00:01Z", "drift_detected", "drift"),
+        (2, "2025-01-01T00:00:00Z", "repair_triggered", "repair"),
+        (None, "2025-01-01T00:00:02Z", "drift_escalated", "drift"),
+    ).has_post_repair_drift()
+    assert not _session(
+        "s1",
+        (1, "2025-01-01T00:00:00Z", "drift_detected", "drift"),
+        (2, "2025-01-01T00:00:01Z", "drift_detected", "drift"),
+    ).has_post_repair_drift()
+    assert not _session(
+        "s1",
+        (None, "2025-01-01T00:00:00Z", "repair_triggered", "repair"),
+        (1, "2025-01-01T00:00:01Z", "drift_detected", "drift"),
+    ).has_post_repair_drift()
@@ -0,0 +1,59 @@
+import io
+import json
+import os
+import sys
+
+import pytest
+
+# ---------------------------------------------------------
+# Path Setup: pld_runtime is imported from the repository root.
+# ---------------------------------------------------------
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from pld_runtime.logging.exporters.exporter_jsonl import JsonlExporter  # noqa: E402
+
+
+class _CountingFile(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.writes = 0
+
+    def write(self, s):
+        self.writes += 1
+        return super().write(s)
+
+
+def _events(n):
+    return [
+        {"session_id": "s1", "turn_sequence": i, "pld": {"phase": "continue"}}
+        for i in range(1, n + 1)
+    ]
+
+
+def test_export_events_writes_batch_in_one_call():
+    f = _CountingFile()
+    exporter = JsonlExporter(f, own_file=False)
+
+    exporter.export_events("s1", _events(3))
+
+    assert f.writes == 1
+    assert [json.loads(line) for line in f.getvalue().splitlines()] == _events(3)
+    assert f.getvalue().endswith("\n")
+
+
+def test_export_events_empty_batch_writes_nothing():
+    f = _CountingFile()
+    JsonlExporter(f, own_file=False).export_events("s1", [])
+
+    assert f.writes == 0
+
+
+def test_export_events_failed_serialization_writes_nothing():
+    f = _CountingFile()
+    exporter = JsonlExporter(f, own_file=False)
+    events = _events(2) + [{"session_id": "s1", "bad": object()}]
+
+    with pytest.raises(TypeError):
+        exporter.export_events("s1", events)
+
+    assert f.getvalue() == ""
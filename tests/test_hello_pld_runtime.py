@@ -0,0 +1,72 @@
+import importlib.util
+import json
+import os
+import sys
+import threading
+
+# ---------------------------------------------------------
+# Load the legacy quickstart script directly from its path;
+# it is a standalone script, not part of an installed package.
+# ---------------------------------------------------------
+_SCRIPT = os.path.abspath(
+    os.path.join(
+        os.path.dirname(__file__), "..", "archive", "archive_legacy", "hello_pld_runtime.py"
+    )
+)
+_spec = importlib.util.spec_from_file_location("hello_pld_runtime", _SCRIPT)
+hello_pld_runtime = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = hello_pld_runtime
+_spec.loader.exec_module(hello_pld_runtime)
+
+
+def test_sessions_get_distinct_ids():
+    """Each default-constructed Session must get its own session_id."""
+    a = hello_pld_runtime.Session()
+    b = hello_pld_runtime.Session()
+
+    assert a.session_id != b.session_id
+
+
+def test_run_turn_events_share_session_id():
+    session = hello_pld_runtime.Session()
+    events = list(hello_pld_runtime.run_turn(session, "switch topic"))
+
+    assert events
+    assert {e["session_id"] for e in events} == {session.session_id}
+
+
+def test_dumps_event_accepts_non_str_payload_keys():
+    event = {"event_type": "info", "payload": {1: "a", "k": "é"}}
+    expected = json.dumps(event, ensure_ascii=False, indent=2)
+
+    assert hello_pld_runtime.dumps_event(event) == expected
+    assert hello_pld_runtime._dumps_event_bytes(event) == expected.encode("utf-8")
+
+
+def test_new_event_id_is_thread_safe():
+    ids = []
+    errors = []
+
+    def worker():
+        try:
+            ids.extend(hello_pld_runtime.new_event_id() for _ in range(2000))
+        except Exception as exc:
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    assert len(set(ids)) == 8 * 2000
+
+
+def test_detect_drift_sees_keywords_added_at_runtime(monkeypatch):
+    assert not hello_pld_runtime.detect_drift("Tell me about Volcanoes")
+
+    monkeypatch.setattr(
+        hello_pld_runtime, "DRIFT_KEYWORDS", hello_pld_runtime.DRIFT_KEYWORDS | {"volcano"}
+    )
+    assert hello_pld_runtime.detect_drift("Tell me about Volcanoes")
@@ -0,0 +1,121 @@
+import importlib.util
+import json
+import os
+import sys
+import threading
+from datetime import datetime, timezone
+
+import pytest
+
+# ---------------------------------------------------------
+# Path Setup: pld_runtime is imported from the repository root; the
+# LangGraph integration is an example script, loaded from its path.
+# ---------------------------------------------------------
+_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+sys.path.insert(0, _ROOT)
+_SCRIPT = os.path.join(
+    _ROOT, "examples", "langgraph_assistants", "pld_runtime_integration.py"
+)
+
+
+@pytest.fixture
+def integ():
+    """A fresh copy of the integration module (its observer state is global)."""
+    spec = importlib.util.spec_from_file_location("pld_runtime_integration", _SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    yield module
+    module.shutdown_pld_observer()
+
+
+def _read_events(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_background_emit_keeps_fifo_order(integ, tmp_path):
+    path = tmp_path / "events.jsonl"
+    integ.init_pld_observer(jsonl_path=str(path), background=True)
+
+    for turn in range(1, 21):
+        integ.emit_continue_event({"session_id": "s1", "turn": turn})
+    integ.shutdown_pld_observer()
+
+    assert [e["turn_sequence"] for e in _read_events(path)] == list(range(1, 21))
+
+
+def test_background_emit_keeps_emit_time_timestamp(integ, tmp_path, monkeypatch):
+    class _FixedDatetime:
+        @staticmethod
+        def now(tz=None):
+            return datetime(2001, 2, 3, 4, 5, 6, tzinfo=timezone.utc)
+
+    monkeypatch.setattr(integ, "datetime", _FixedDatetime)
+    path = tmp_path / "events.jsonl"
+    integ.init_pld_observer(jsonl_path=str(path), background=True)
+
+    integ.emit_continue_event({"session_id": "s1", "turn": 1})
+    integ.shutdown_pld_observer()
+
+    assert [e["timestamp"] for e in _read_events(path)] == ["2001-02-03T04:05:06Z"]
+
+
+def test_shutdown_drains_queued_events(integ, tmp_path, monkeypatch):
+    gate = threading.Event()
+    build_and_record = integ._build_and_record
+
+    def _gated(*args):
+        gate.wait()
+        build_and_record(*args)
+
+    monkeypatch.setattr(integ, "_build_and_record", _gated)
+    path = tmp_path / "events.jsonl"
+    integ.init_pld_observer(jsonl_path=str(path), background=True)
+
+    for turn in range(1, 6):
+        integ.emit_continue_event({"session_id": "s1", "turn": turn})
+    gate.set()
+    integ.shutdown_pld_observer()
+
+    assert len(_read_events(path)) == 5
+
+
+@pytest.mark.parametrize("background", [False, True])
+def test_emits_after_shutdown_are_dropped(integ, tmp_path, background):
+    path = tmp_path / "events.jsonl"
+    integ.init_pld_observer(jsonl_path=str(path), background=background)
+
+    integ.emit_continue_event({"session_id": "s1", "turn": 1})
+    integ.shutdown_pld_observer()
+    integ.emit_continue_event({"session_id": "s1", "turn": 2})
+    integ.emit_session_closed({"session_id": "s1", "turn": 2})
+
+    assert [e["turn_sequence"] for e in _read_events(path)] == [1]
+
+
+def test_timed_out_worker_keeps_its_own_pipeline(integ, tmp_path, monkeypatch):
+    gate = threading.Event()
+    build_and_record = integ._build_and_record
+
+    def _gated(*args):
+        gate.wait()
+        build_and_record(*args)
+
+    monkeypatch.setattr(integ, "_build_and_record", _gated)
+    monkeypatch.setattr(integ, "_SHUTDOWN_JOIN_TIMEOUT", 0.01)
+    first = tmp_path / "first.jsonl"
+    integ.init_pld_observer(jsonl_path=str(first), background=True)
+    worker = integ._emit_thread
+
+    integ.emit_continue_event({"session_id": "s1", "turn": 1})
+    integ.shutdown_pld_observer()
+    assert worker.is_alive()
+
+    second = tmp_path / "second.jsonl"
+    integ.init_pld_observer(jsonl_path=str(second))
+    gate.set()
+    worker.join()
+    integ.shutdown_pld_observer()
+
+    assert [e["session_id"] for e in _read_events(first)] == ["s1"]
+    assert _read_events(second) == []
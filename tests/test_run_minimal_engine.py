@@ -0,0 +1,113 @@
+import importlib.util
+import os
+import sys
+
+import pytest
+
+# ---------------------------------------------------------
+# Load the legacy engine script directly from its path; it imports its
+# sibling hello_pld_runtime.py, so that directory goes on sys.path.
+# ---------------------------------------------------------
+_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..", "archive", "archive_legacy")
+)
+sys.path.insert(0, _DIR)
+_spec = importlib.util.spec_from_file_location(
+    "run_minimal_engine", os.path.join(_DIR, "run_minimal_engine.py")
+)
+run_minimal_engine = importlib.util.module_from_spec(_spec)
+sys.modules[_spec.name] = run_minimal_engine
+_spec.loader.exec_module(run_minimal_engine)
+
+
+def _event_types(events):
+    return [e["event_type"] for e in events]
+
+
+def test_subclass_hooks_receive_original_input():
+    calls = []
+
+    class Engine(run_minimal_engine.MinimalEngine):
+        def _agent_step(self, user_input):
+            calls.append(("agent", user_input))
+            return super()._agent_step(user_input)
+
+        def _detect_phase(self, user_input, candidate_response):
+            calls.append(("detect", user_input))
+            return super()._detect_phase(user_input, candidate_response)
+
+    _, events = Engine().run_turn("Let's SWITCH topic")
+    _, expected = run_minimal_engine.MinimalEngine().run_turn("Let's SWITCH topic")
+
+    assert calls == [("agent", "Let's SWITCH topic"), ("detect", "Let's SWITCH topic")]
+    assert _event_types(events) == _event_types(expected)
+
+
+def test_validate_event_mode_keyword_is_deprecated_alias():
+    bad = {"event_type": "drift_detected", "pld": {"phase": "repair", "code": "D1_x"}}
+
+    with pytest.deprecated_call():
+        run_minimal_engine.validate_event(bad, mode="warn")
+    with pytest.deprecated_call(), pytest.raises(ValueError):
+        run_minimal_engine.validate_event(bad, mode="strict")
+
+
+def test_drift_scan_covers_every_keyword():
+    for kw in run_minimal_engine.DRIFT_KEYWORDS:
+        assert run_minimal_engine.default_drift_detector(f"x {kw.upper()} y", "")[0]
+    with pytest.raises(AttributeError):
+        run_minimal_engine.DRIFT_KEYWORDS.add("volcano")
+
+
+def test_engine_reads_config_changes_after_construction():
+    engine = run_minimal_engine.MinimalEngine()
+    engine.config.drift_detector = lambda user_input, plan: (True, "D4_tool_error")
+    engine.config.emit_payloads = False
+
+    _, events = engine.run_turn("Continue with the main task")
+
+    assert "drift_detected" in _event_types(events)
+    assert all(e["payload"] == {} for e in events)
+
+
+_TURNS = ["Hello", "Let's switch topic", "   ", "Continue with the main task"]
+
+
+def test_make_event_trusted_skips_validation():
+    kwargs = dict(
+        session_id="s1",
+        event_type="drift_detected",
+        phase="repair",
+        code="D1_instruction",
+        turn_sequence=1,
+    )
+
+    event = run_minimal_engine.make_event(trusted=True, **kwargs)
+    assert event["pld"] == {"phase": "repair", "code": "D1_instruction"}
+    with pytest.raises(ValueError):
+        run_minimal_engine.make_event(**kwargs)
+
+
+def test_engine_events_pass_strict_validation():
+    engine = run_minimal_engine.MinimalEngine()
+    for user_input in _TURNS:
+        _, events = engine.run_turn(user_input)
+        for event in events:
+            run_minimal_engine.validate_event(event, strict=True)
+
+
+def test_emit_payloads_false_emits_empty_payloads():
+    quiet = run_minimal_engine.MinimalEngine(
+        run_minimal_engine.EngineConfig(emit_payloads=False)
+    )
+    default = run_minimal_engine.MinimalEngine()
+
+    for user_input in _TURNS:
+        response, events = quiet.run_turn(user_input)
+        expected_response, expected = default.run_turn(user_input)
+
+        assert response == expected_response
+        assert _event_types(events) == _event_types(expected)
+        assert all(e["payload"] == {} for e in events)
+        assert len({id(e["payload"]) for e in events}) == len(events)
+        assert any(e["payload"] for e in expected)